@@ -1,19 +1,174 @@
 """
 Agent class for managing interactions with OpenAI's API.
 """
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
 import json
-from typing import Any
+import os
+import threading
+from typing import Any, TYPE_CHECKING
 import time
 
-from openai import OpenAI
-from openai.types.responses import Response
+import random
+
+import httpx
+from openai import (APIConnectionError, APITimeoutError, AsyncOpenAI, OpenAI,
+                    RateLimitError)
+
+if TYPE_CHECKING:
+    from openai.types.responses import Response
+
+#  orjson parses tool-call arguments several times faster than the stdlib;
+#  fall back transparently where it is not installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 
 from tools.tool import Tool
+from utility.llm_cache import LLMCache
 from utility.md_reporter import MDReporter
 from utility.prepared_msg_buff import preparedMsgBuff
 
 
+#  Transient server-side conditions worth retrying instead of aborting the
+#  whole agent call.
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+_MAX_ATTEMPTS = 5
+
+#  Request used to fold a long conversation into a compact memory block
+#  once the context passes the compression threshold.
+_SUMMARY_PROMPT = """Summarize your work in this conversation so far into
+a compact memory block: the overall goal, what has been done, the key
+results with exact filenames and numbers, open tasks and the next steps.
+Answer with the summary only and do not call any tools."""
+
+
+def _retry_wait(attempt: int) -> float:
+    """
+    Computes the jittered exponential backoff before the next attempt.
+
+    Args:
+        attempt: Zero-based index of the failed attempt.
+
+    Returns:
+        Seconds to wait, capped at 16.
+    """
+    return min(16.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+_SHARED_CLIENT = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _get_shared_client() -> OpenAI:
+    """
+    Lazily creates the OpenAI client shared by all agents.
+
+    One client means one connection pool: sub-agents reuse the same
+    TCP+TLS connections instead of paying a handshake per agent, with
+    HTTP/2 multiplexing concurrent calls over one connection where the
+    optional h2 dependency is available.
+
+    Returns:
+        The shared OpenAI client instance.
+    """
+    global _SHARED_CLIENT  # pylint: disable=global-statement
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None:
+            limits = httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            )
+            try:
+                http_client = httpx.Client(http2=True, limits=limits)
+            except ImportError:
+                http_client = httpx.Client(limits=limits)
+            _SHARED_CLIENT = OpenAI(http_client=http_client)
+    return _SHARED_CLIENT
+
+
+_SHARED_ASYNC_CLIENT = None
+
+
+def _get_shared_async_client() -> AsyncOpenAI:
+    """
+    Lazily creates the AsyncOpenAI client shared by all agents.
+
+    Mirrors _get_shared_client for the asynchronous call path.
+
+    Returns:
+        The shared AsyncOpenAI client instance.
+    """
+    global _SHARED_ASYNC_CLIENT  # pylint: disable=global-statement
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_ASYNC_CLIENT is None:
+            limits = httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            )
+            try:
+                http_client = httpx.AsyncClient(http2=True, limits=limits)
+            except ImportError:
+                http_client = httpx.AsyncClient(limits=limits)
+            _SHARED_ASYNC_CLIENT = AsyncOpenAI(http_client=http_client)
+    return _SHARED_ASYNC_CLIENT
+
+
+def close_shared_clients():
+    """
+    Closes the shared OpenAI clients and their connection pools.
+
+    Call once at the end of a run so keepalive connections are shut down
+    cleanly instead of lingering until interpreter teardown. The clients
+    are rebuilt lazily if another call follows.
+    """
+    global _SHARED_CLIENT, _SHARED_ASYNC_CLIENT  # pylint: disable=global-statement
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is not None:
+            _SHARED_CLIENT.close()
+            _SHARED_CLIENT = None
+        if _SHARED_ASYNC_CLIENT is not None:
+            #  The async client needs an event loop to close; outside of
+            #  one, dropping the reference lets the transport clean up on
+            #  garbage collection.
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(_SHARED_ASYNC_CLIENT.close())
+            _SHARED_ASYNC_CLIENT = None
+
+
+def _serialize_result(result) -> str:
+    """
+    Serializes a tool result for the function_call_output message.
+
+    Strings pass through unchanged. Other objects are rendered as JSON so
+    the next model turn sees well-formed data instead of a python repr.
+
+    Args:
+        result: The value returned by the tool.
+
+    Returns:
+        The string representation of the result.
+    """
+    if isinstance(result, str):
+        return result
+    try:
+        if orjson is not None:
+            return orjson.dumps(result).decode()
+        return json.dumps(result)
+    except TypeError:
+        return str(result)
+
+
 class MaxCallsExceededError(Exception):
     """Custom exception raised when the maximum number of calls is exceeded."""
     pass
@@ -26,8 +181,9 @@ class Agent:
     Attributes:
         stop:
             A boolean indicating weather the agent is able to proceed.
-        response_ids: 
-            list of the ids of previous responses the agent has generated.        
+        response_ids:
+            deque with the ids of the most recent responses the agent has
+            generated.
     """
 
     def __init__(
@@ -37,9 +193,12 @@ class Agent:
         system_prompt: str,
         tools: list[Tool],
         reporter: MDReporter,
-        prepared_message_buffer: preparedMsgBuff = preparedMsgBuff(),
+        prepared_message_buffer: preparedMsgBuff = None,
         max_calls: int = 10,
-        client: OpenAI = OpenAI()
+        client: OpenAI = None,
+        llm_cache: LLMCache = None,
+        echo_stream: bool = False,
+        stop_event: threading.Event = None
         ):
         """
         Initializes new agent based on parameters.
@@ -50,25 +209,92 @@ class Agent:
             system_prompt: developer message to initialize the model
             tools: a list of tools the model can use
             reporter: instance of MDReporter used to log all interactions
-            prepared_message_buffer: buffer saving messages for later
+            prepared_message_buffer:
+                buffer saving messages for later, each agent gets its own
+                buffer if none is provided
             max_calls:  how often the model can be called before emergency stop
-            client: used to connect to LLM API and submit calls        
+            client:
+                used to connect to LLM API and submit calls, resolves to
+                the shared pooled client if none is provided
+            llm_cache:
+                persistent cache replaying tool-free calls with identical
+                inputs, caching is disabled if none is provided
+            echo_stream:
+                whether message text is printed to stdout as it streams
+                instead of only appearing in the returned output text
+            stop_event:
+                event signalling the end of the whole project; once set,
+                the agent refuses further API calls
 
         """
 
+        #  Defaults are created here instead of in the signature: defaults
+        #  are evaluated once at import time, which would build an OpenAI
+        #  client on import and share one mutable buffer across all agents.
+        if prepared_message_buffer is None:
+            prepared_message_buffer = preparedMsgBuff()
+        if client is None:
+            client = _get_shared_client()
+
         self._client = client
         self._model = model
         self._agent_name = agent_name
         self._system_prompt = system_prompt
         self._tools = tools
+        #  The schema list and the name lookup never change after
+        #  construction; precomputing them keeps them off the per-call path.
+        self._tools_schema = [tool.schema for tool in tools]
+        self._tools_by_name = {tool.name: tool for tool in tools}
+
+        #  The system prompt and the tool schemas form the static prompt
+        #  prefix the provider can cache across calls. Logging its hash
+        #  makes any accidental drift (which would void the cache and the
+        #  cached_tokens discount) visible in the metrics.
+        prefix = json.dumps(
+            {"instructions": system_prompt, "tools": self._tools_schema},
+            sort_keys=True,
+            default=str
+        )
+        reporter.report_metrics(
+            "prefix_hash_" + agent_name,
+            hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16],
+            mode="overwrite"
+        )
         self._reporter = reporter
         self._prepared_message_buffer = prepared_message_buffer
+        self._llm_cache = llm_cache
+        self._echo_stream = echo_stream
+        self._stop_event = stop_event
 
         self._max_calls = max_calls
         self._call_count = 0
         self.stop = False
 
-        self.response_ids = []
+        self._tool_executor = None
+        self._buffer_lock = threading.Lock()
+        self._pending_tool_futures = {}
+        #  Tool outputs held back by a terminal tool; delivered with the
+        #  next request on the chain so its function calls get resolved.
+        self._pending_outputs = []
+
+        #  Only the most recent id is ever read back; keeping a short
+        #  window instead of the full history avoids unbounded growth over
+        #  long multi-agent runs.
+        self.response_ids = collections.deque(maxlen=8)
+
+        #  Whether the most recent call() executed any tools; callers use
+        #  this to tell productive turns from idle ones.
+        self.last_call_had_tool_calls = True
+
+        #  Context compression bounds the quadratic prefill cost of long
+        #  previous_response_id chains: once a response reports more input
+        #  tokens than the threshold, the conversation is folded into a
+        #  summary and the chain restarts from it. 0 disables compression.
+        #  Crossing the threshold only marks compression as pending; the
+        #  summary request runs at the start of the next clean turn.
+        self._compress_at = int(os.getenv("CONTEXT_COMPRESS_TOKENS", "100000"))
+        self._compress_pending = False
+        self._context_summary = None
 
     def iterate(self):
         """
@@ -85,7 +311,7 @@ class Agent:
             self,
             messages: list[Any],
             last_response_id: int = None
-            ) -> Response:
+            ) -> "Response":
         """
         Makes OpenAI API call and logs interaction.
 
@@ -102,43 +328,236 @@ class Agent:
             OpenAi response object containing the information on the call.
 
         Raises:
-            MaxCallsExceededError: Agent has no calls left     
+            MaxCallsExceededError: Agent has no calls left
         """
+        #  A set stop event means the project ended while this branch was
+        #  still in flight; stop spending budget on it immediately.
+        if self._stop_event is not None and self._stop_event.is_set():
+            self.stop = True
+            raise MaxCallsExceededError("Project was ended")
         if self.stop:
             raise MaxCallsExceededError("Max calls reached")
         self.iterate()
         self._reporter.report_metrics("num_calls", 1, mode = "add")
 
+        if self._pending_outputs:
+            #  Outputs of a terminal turn resolve the last response's
+            #  function calls before anything else is sent on the chain.
+            messages = self._pending_outputs + messages
+            self._pending_outputs = []
+
+        if self._compress_pending:
+            self._maybe_compress_context(messages)
+
+        if self._context_summary is not None:
+            messages = [{
+                "role": "user",
+                "content": "Compact summary of your previous work (older "
+                           "context was compressed):\n"
+                           + self._context_summary
+            }] + messages
+            self._context_summary = None
 
         self._reporter.report_messages(messages, self._agent_name)
 
-        if last_response_id is None:
-            if self.response_ids:
-                last_response_id = self.response_ids[-1]
-            else:
-                response = self._client.responses.create(
-                    model=self._model,
-                    instructions=self._system_prompt,
-                    input=messages,
-                    tools=[tool.schema for tool in self._tools],
-                    )
-                self.response_ids.append(response.id)
-                self._reporter.report_assistant_response(
-                    response, self._agent_name)
-                return response
-
-        response = self._client.responses.create(
-            model=self._model,
-            instructions=self._system_prompt,
-            input=messages,
-            tools=[tool.schema for tool in self._tools],
-            previous_response_id=last_response_id
-            )
+        if last_response_id is None and self.response_ids:
+            last_response_id = self.response_ids[-1]
+
+        kwargs = {
+            "model": self._model,
+            "instructions": self._system_prompt,
+            "input": messages,
+            "tools": self._tools_schema,
+            "parallel_tool_calls": True,
+        }
+        if last_response_id is not None:
+            kwargs["previous_response_id"] = last_response_id
+
+        try:
+            response = self._stream_response(**kwargs)
+        except _RETRYABLE_ERRORS:
+            #  The server rejected every attempt without doing real work;
+            #  give the call budget back so transient outages do not eat
+            #  into max_calls.
+            self._call_count -= 1
+            self._reporter.report_metrics("num_calls", -1, mode="add")
+            raise
 
         self.response_ids.append(response.id)
         self._reporter.report_assistant_response(response, self._agent_name)
+        usage = getattr(response, "usage", None)
+        input_tokens = getattr(usage, "input_tokens", 0) if usage else 0
+        if 0 < self._compress_at <= input_tokens:
+            self._compress_pending = True
         return response
 
+    def _maybe_compress_context(self, messages: list[Any]):
+        """
+        Folds an overlong conversation into a summary and restarts it.
+
+        Runs at the start of a turn, and only while the chain is clean: a
+        summary request issued while the last response still has
+        unresolved function calls is rejected by the server, and clearing
+        the chain then would orphan the pending function_call_output
+        items. The compression therefore stays pending until the outgoing
+        input carries no tool outputs. On success the chain is cleared so
+        the turn starts fresh with the summary injected as the first
+        message. Bounds input tokens, and with them time to first token,
+        on long runs.
+
+        Args:
+            messages: The input messages of the turn about to be sent.
+        """
+        if not self.response_ids:
+            self._compress_pending = False
+            return
+        if any(isinstance(m, dict) and m.get("type") == "function_call_output"
+               for m in messages):
+            #  Tool outputs still owed to the last response; try again on
+            #  the next clean turn.
+            return
+        self._compress_pending = False
+
+        try:
+            #  No tools on the summary request: the model must answer in
+            #  text, and nothing it emits can be dispatched for execution.
+            summary = self._stream_response(
+                model=self._model,
+                instructions=self._system_prompt,
+                input=[{"role": "user", "content": _SUMMARY_PROMPT}],
+                previous_response_id=self.response_ids[-1]
+            )
+        except _RETRYABLE_ERRORS:
+            #  Compression is an optimization; keep the full chain if the
+            #  summary call does not go through.
+            return
+
+        self._context_summary = summary.output_text
+        self.response_ids.clear()
+        self._reporter.report_metrics("context_compressions", 1, mode="add")
+
+    def _stream_response(self, **kwargs) -> "Response":
+        """
+        Streams a response from the API and dispatches tool calls early.
+
+        Function calls are submitted to the tool executor the moment their
+        output item finishes streaming, so tool latency overlaps the
+        remaining model decode time. The started futures are picked up by
+        execute_tool_calls via their call id.
+
+        Transient API errors (rate limits, timeouts, connection drops) are
+        retried with jittered exponential backoff instead of aborting the
+        agent call.
+
+        Args:
+            kwargs: Keyword arguments for the responses API call.
+
+        Returns:
+            The completed OpenAi response object.
+
+        Raises:
+            RateLimitError, APITimeoutError, APIConnectionError:
+                The error persisted through all retry attempts.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            dispatched = []
+            try:
+                echoed = False
+                seen_keys = set()
+                with self._client.responses.stream(**kwargs) as stream:
+                    for event in stream:
+                        if (event.type == "response.output_item.done"
+                                and event.item.type == "function_call"
+                                and self._tool_is_concurrent(event.item.name)):
+                            #  Repeats of an already dispatched call are
+                            #  not submitted again; execute_tool_calls
+                            #  reuses the first call's result for them.
+                            key = self._canonical_call_key(event.item)
+                            if key in seen_keys:
+                                continue
+                            seen_keys.add(key)
+                            self._pending_tool_futures[event.item.call_id] = \
+                                self._get_tool_executor().submit(
+                                    self._run_tool_call, event.item)
+                            dispatched.append(event.item.call_id)
+                        elif (self._echo_stream and
+                              event.type == "response.output_text.delta"):
+                            print(event.delta, end="", flush=True)
+                            echoed = True
+                    if echoed:
+                        print(flush=True)
+                    return stream.get_final_response()
+            except _RETRYABLE_ERRORS:
+                #  Tools dispatched during the aborted attempt belong to
+                #  call ids a retried request will never issue again; wait
+                #  for them and drop them so they neither leak nor get
+                #  matched against the next attempt's calls.
+                for call_id in dispatched:
+                    future = self._pending_tool_futures.pop(call_id, None)
+                    if future is not None:
+                        future.result()
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                self._reporter.report_metrics("api_retries", 1, mode="add")
+                time.sleep(_retry_wait(attempt))
+
+    def _cache_keys_for(self, messages: list[Any], last_response_id) -> tuple:
+        """
+        Builds the response cache keys for a call, if it is cacheable.
+
+        Only calls that start a fresh conversation are cacheable: once a
+        previous_response_id is involved the server-side history changes
+        what the model sees beyond the messages in the key.
+
+        Args:
+            messages: The input messages of the call.
+            last_response_id: Id of the last response the agent should see.
+
+        Returns:
+            The key pair for the cache or None if caching does not apply.
+        """
+        if (self._llm_cache is None or last_response_id is not None
+                or self.response_ids):
+            return None
+        return LLMCache.make_keys(
+            self._model, self._system_prompt, self._tools_schema, messages)
+
+    def _cache_lookup(self, cache_keys: tuple, messages: list[Any]):
+        """
+        Replays a cached call result if one exists.
+
+        Args:
+            cache_keys: Key pair from _cache_keys_for, may be None.
+            messages: The input messages, logged on a hit.
+
+        Returns:
+            The cached output text or None.
+        """
+        if cache_keys is None:
+            return None
+        cached = self._llm_cache.get(cache_keys)
+        if cached is not None:
+            self._reporter.report_messages(messages, self._agent_name)
+            self._reporter.report_metrics("llm_cache_hits", 1, mode="add")
+        return cached
+
+    def _cache_store(self, cache_keys: tuple, response, made_tool_calls: bool):
+        """
+        Stores a finished call in the response cache if it is safe to replay.
+
+        Calls that executed tools are never stored: replaying them would
+        skip the tool side effects.
+
+        Args:
+            cache_keys: Key pair from _cache_keys_for, may be None.
+            response: The final response of the call.
+            made_tool_calls: Whether any response in the call had tool calls.
+        """
+        if (cache_keys is None or response is None or made_tool_calls
+                or self.stop):
+            return
+        self._llm_cache.put(cache_keys, response.output_text)
+
     def call(self, messages: list[Any], last_response_id=None):
         """
         Calls the Agent with a list of messages, handles in between tool calls
@@ -149,7 +568,7 @@ class Agent:
                 A list of messages in the format:
                 {"role": "user", "content": "<content>"}
             last_response_id:
-                Id of the last message in a existing conversation the agent 
+                Id of the last message in a existing conversation the agent
                 should see. Defaults to the id of the last response created by
                 the agent.
         Returns:
@@ -158,30 +577,41 @@ class Agent:
         Raises:
             MaxCallsExceededError: Agent has no calls left.
             ValueError: The message list is empty.
-        
+
         """
         if messages == []:
             raise ValueError("Message list is empty")
         response = None
 
+        cache_keys = self._cache_keys_for(messages, last_response_id)
+        cached = self._cache_lookup(cache_keys, messages)
+        if cached is not None:
+            return cached
+        made_tool_calls = False
+
         #  create response and check if there are tool calls. Results of tool
         #  calls get stored in messages and initiate next call until there are
         #  no more tool calls.
 
         while not messages == [] and not self.stop:
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = self._create_response(messages, last_response_id)
-            mid_time = time.time()
+            mid_time = time.perf_counter()
             messages = self.execute_tool_calls(response)
-            end_time = time.time()
-            self._reporter.report_metrics("response_time",
-                                            mid_time - start_time, mode="add")
-            self._reporter.report_metrics("tool_call_time",
-                                            end_time - mid_time, mode="add")
+            end_time = time.perf_counter()
+            if any(output.type == "function_call"
+                   for output in response.output):
+                made_tool_calls = True
+            self._reporter.report_metrics_batch({
+                "response_time": mid_time - start_time,
+                "tool_call_time": end_time - mid_time
+            }, mode="add")
         if self.stop and messages:
             self._reporter.report_messages(messages, self._agent_name)
+        self.last_call_had_tool_calls = made_tool_calls
         if response is None:
             return "No response"
+        self._cache_store(cache_keys, response, made_tool_calls)
         return response.output_text
 
     def call_function(self, name: str, args) -> str:
@@ -195,11 +625,11 @@ class Agent:
         Returns:
             Text result of the tool call  
         """
-        result = "function not found"
-        for tool in self._tools:
-            if tool.name == name:
-                result = tool.run(args)
-                break
+        tool = self._tools_by_name.get(name)
+        if tool is None:
+            result = "function not found"
+        else:
+            result = tool.run(args)
         self._reporter.report_metrics("tool_calls", 1, mode="add")
         print("\n Result:")
         print(result)
@@ -207,36 +637,366 @@ class Agent:
 
         return result
 
-    def execute_tool_calls(self, response: Response) -> list[Any]:
+    def _get_tool_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Lazily creates the thread pool used for concurrent tool calls.
+
+        One executor per agent avoids deadlocks between parent agents and
+        sub-agents that dispatch their own tool calls.
+
+        Returns:
+            The thread pool executor owned by this agent.
+        """
+        if self._tool_executor is None:
+            max_workers = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8"))
+            self._tool_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers)
+        return self._tool_executor
+
+    def _run_tool_call(self, tool_call) -> dict:
+        """
+        Executes a single tool call and wraps the result in a tool message.
+
+        Errors are isolated per call: a failing tool produces an error
+        function_call_output instead of crashing the whole batch.
+
+        Args:
+            tool_call: Function call entry from an OpenAi response.
+
+        Returns:
+            Tool message with the result of the tool call.
+        """
+        name = tool_call.name
+        args = _json_loads(tool_call.arguments)
+
+        print(f"\n Executing: {name}(args={args})")
+
+        try:
+            result = self.call_function(name, args)
+        except Exception as e:  # pylint: disable=broad-except
+            self._reporter.report_metrics("tool_call_errors", 1, mode="add")
+            result = f"Tool call {name} failed with error: {e}"
+
+        return {
+            "type": "function_call_output",
+            "call_id": tool_call.call_id,
+            "output": _serialize_result(result)
+        }
+
+    @staticmethod
+    def _canonical_call_key(tool_call) -> tuple:
+        """
+        Builds a canonical key identifying a tool call by name and args.
+
+        The arguments are re-serialized with sorted keys so two calls with
+        the same content but different key order map to the same key.
+
+        Args:
+            tool_call: Function call entry from an OpenAi response.
+
+        Returns:
+            Tuple of tool name and canonical argument string.
+        """
+        args = _json_loads(tool_call.arguments)
+        if orjson is not None:
+            canonical = orjson.dumps(
+                args, option=orjson.OPT_SORT_KEYS).decode()
+        else:
+            canonical = json.dumps(args, sort_keys=True)
+        return (tool_call.name, canonical)
+
+    def execute_tool_calls(self, response: "Response") -> list[Any]:
         """
         Executes tool calls in a response and returns resulting tool messages.
 
+        Independent tool calls are dispatched concurrently on the agents
+        thread pool. Tools that declare concurrent=False are executed
+        serially in the calling thread. Calls that repeat the same name and
+        arguments within one response are executed once and their result is
+        reused. The resulting tool messages keep the order in which the
+        calls appeared in the response.
+
         Args:
             response: OpenAi response object
 
         Returns:
-            List of tool messages with the results of the tool calls. 
+            List of tool messages with the results of the tool calls.
         """
-        tool_messages = []
-        for tool_call in response.output:
-            if tool_call.type != "function_call":
+        tool_calls = [tool_call for tool_call in response.output
+                      if tool_call.type == "function_call"]
+
+        results = [None] * len(tool_calls)
+        futures = {}
+        first_index = {}
+        duplicates = {}
+
+        for i, tool_call in enumerate(tool_calls):
+            if tool_call.call_id in self._pending_tool_futures:
+                #  Already dispatched while streaming, keep its future.
+                futures[i] = self._pending_tool_futures.pop(tool_call.call_id)
+                first_index.setdefault(self._canonical_call_key(tool_call), i)
                 continue
 
-            name = tool_call.name
-            args = json.loads(tool_call.arguments)
+            key = self._canonical_call_key(tool_call)
+            if key in first_index:
+                duplicates[i] = first_index[key]
+                continue
+            first_index[key] = i
 
-            print(f"\n Executing: {name}(args={args})")
+            if self._tool_is_concurrent(tool_call.name):
+                futures[i] = self._get_tool_executor().submit(
+                    self._run_tool_call, tool_call)
 
-            result = self.call_function(name, args)
-            tool_messages.append({
-                "type": "function_call_output",
-                "call_id": tool_call.call_id,
-                "output": str(result)
-            })
-
-            for pm in self._prepared_message_buffer.get_msg():
-                tool_messages.append(pm)
+        for i, tool_call in enumerate(tool_calls):
+            if i in duplicates:
+                continue
+            if i in futures:
+                results[i] = futures[i].result()
+            else:
+                results[i] = self._run_tool_call(tool_call)
+
+        for i, tool_call in enumerate(tool_calls):
+            if i in duplicates:
+                results[i] = {
+                    "type": "function_call_output",
+                    "call_id": tool_call.call_id,
+                    "output": results[duplicates[i]]["output"]
+                }
+                self._reporter.report_metrics(
+                    "duplicate_tool_calls", 1, mode="add")
+
+        #  A terminal tool (end_project, final report, ...) completes the
+        #  call; returning no messages ends the tool loop instead of
+        #  spending another model turn on an already finished task. The
+        #  outputs are held back and prepended to the next request on this
+        #  chain: a follow-up whose previous response still has unresolved
+        #  function calls would be rejected by the server.
+        if any(self._tool_is_terminal(tool_call.name)
+               for tool_call in tool_calls):
+            self._pending_outputs.extend(results)
+            return []
+
+        tool_messages = list(results)
+
+        with self._buffer_lock:
+            tool_messages.extend(self._prepared_message_buffer.get_msg())
+            self._prepared_message_buffer.clear_msg()
+
+        return tool_messages
+
+    def _tool_is_terminal(self, name: str) -> bool:
+        """
+        Checks if the tool with the given name completes the agent call.
+
+        Args:
+            name: name of the tool to check
+
+        Returns:
+            True if the tool is terminal.
+        """
+        tool = self._tools_by_name.get(name)
+        return tool.terminal if tool is not None else False
+
+    def _tool_is_concurrent(self, name: str) -> bool:
+        """
+        Checks if the tool with the given name may run concurrently.
+
+        Args:
+            name: name of the tool to check
+
+        Returns:
+            True if the tool is safe for concurrent execution.
+        """
+        tool = self._tools_by_name.get(name)
+        return tool.concurrent if tool is not None else True
+
+    async def _acreate_response(
+            self,
+            messages: list[Any],
+            last_response_id: int = None
+            ) -> "Response":
+        """
+        Asynchronous counterpart of _create_response.
+
+        Awaiting the API call frees the event loop, so other agents or
+        tool calls can progress while this agents response is in flight.
+
+        Args:
+            messages:
+                A list of messages in the format:
+                {"role": "user", "content": "<content>"}
+            last_response_id:
+                Id of the last message in a existing conversation the agent
+                should see. Defaults to the id of the last response created
+                by this agent or none if its the first call.
+
+        Returns:
+            OpenAi response object containing the information on the call.
+
+        Raises:
+            MaxCallsExceededError: Agent has no calls left
+        """
+        if self._stop_event is not None and self._stop_event.is_set():
+            self.stop = True
+            raise MaxCallsExceededError("Project was ended")
+        if self.stop:
+            raise MaxCallsExceededError("Max calls reached")
+        self.iterate()
+        self._reporter.report_metrics("num_calls", 1, mode="add")
+
+        if self._pending_outputs:
+            messages = self._pending_outputs + messages
+            self._pending_outputs = []
+
+        self._reporter.report_messages(messages, self._agent_name)
+
+        if last_response_id is None and self.response_ids:
+            last_response_id = self.response_ids[-1]
+
+        kwargs = {
+            "model": self._model,
+            "instructions": self._system_prompt,
+            "input": messages,
+            "tools": self._tools_schema,
+            "parallel_tool_calls": True,
+        }
+        if last_response_id is not None:
+            kwargs["previous_response_id"] = last_response_id
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                response = await _get_shared_async_client().responses.create(
+                    **kwargs)
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    self._call_count -= 1
+                    self._reporter.report_metrics("num_calls", -1, mode="add")
+                    raise
+                self._reporter.report_metrics("api_retries", 1, mode="add")
+                await asyncio.sleep(_retry_wait(attempt))
+
+        self.response_ids.append(response.id)
+        self._reporter.report_assistant_response(response, self._agent_name)
+        return response
+
+    async def acall(self, messages: list[Any], last_response_id=None):
+        """
+        Asynchronous counterpart of call.
+
+        Use this from an event loop when several agents should progress
+        concurrently; call() stays available for the synchronous path.
+
+        Args:
+            messages:
+                A list of messages in the format:
+                {"role": "user", "content": "<content>"}
+            last_response_id:
+                Id of the last message in a existing conversation the agent
+                should see. Defaults to the id of the last response created
+                by the agent.
+        Returns:
+            Either the output text or No_response if there is no response
+
+        Raises:
+            MaxCallsExceededError: Agent has no calls left.
+            ValueError: The message list is empty.
+
+        """
+        if messages == []:
+            raise ValueError("Message list is empty")
+        response = None
+
+        cache_keys = self._cache_keys_for(messages, last_response_id)
+        cached = self._cache_lookup(cache_keys, messages)
+        if cached is not None:
+            return cached
+        made_tool_calls = False
+
+        while not messages == [] and not self.stop:
+            start_time = time.perf_counter()
+            response = await self._acreate_response(messages, last_response_id)
+            mid_time = time.perf_counter()
+            messages = await self.aexecute_tool_calls(response)
+            end_time = time.perf_counter()
+            if any(output.type == "function_call"
+                   for output in response.output):
+                made_tool_calls = True
+            self._reporter.report_metrics_batch({
+                "response_time": mid_time - start_time,
+                "tool_call_time": end_time - mid_time
+            }, mode="add")
+        if self.stop and messages:
+            self._reporter.report_messages(messages, self._agent_name)
+        self.last_call_had_tool_calls = made_tool_calls
+        if response is None:
+            return "No response"
+        self._cache_store(cache_keys, response, made_tool_calls)
+        return response.output_text
+
+    async def aexecute_tool_calls(self, response: "Response") -> list[Any]:
+        """
+        Asynchronous counterpart of execute_tool_calls.
+
+        Concurrency-safe tool calls are fanned out with asyncio.gather,
+        tools with concurrent=False run one after another. The resulting
+        tool messages keep the order of the calls in the response.
+
+        Args:
+            response: OpenAi response object
+
+        Returns:
+            List of tool messages with the results of the tool calls.
+        """
+        tool_calls = [tool_call for tool_call in response.output
+                      if tool_call.type == "function_call"]
+
+        results = [None] * len(tool_calls)
+        first_index = {}
+        duplicates = {}
+
+        for i, tool_call in enumerate(tool_calls):
+            key = self._canonical_call_key(tool_call)
+            if key in first_index:
+                duplicates[i] = first_index[key]
+            else:
+                first_index[key] = i
+
+        async def run(index, tool_call):
+            results[index] = await asyncio.to_thread(
+                self._run_tool_call, tool_call)
+
+        await asyncio.gather(*[
+            run(i, tool_call) for i, tool_call in enumerate(tool_calls)
+            if i not in duplicates and self._tool_is_concurrent(tool_call.name)
+        ])
+
+        for i, tool_call in enumerate(tool_calls):
+            if i not in duplicates and results[i] is None:
+                results[i] = await asyncio.to_thread(
+                    self._run_tool_call, tool_call)
+
+        for i, tool_call in enumerate(tool_calls):
+            if i in duplicates:
+                results[i] = {
+                    "type": "function_call_output",
+                    "call_id": tool_call.call_id,
+                    "output": results[duplicates[i]]["output"]
+                }
+                self._reporter.report_metrics(
+                    "duplicate_tool_calls", 1, mode="add")
+
+        if any(self._tool_is_terminal(tool_call.name)
+               for tool_call in tool_calls):
+            self._pending_outputs.extend(results)
+            return []
+
+        tool_messages = list(results)
+
+        with self._buffer_lock:
+            tool_messages.extend(self._prepared_message_buffer.get_msg())
             self._prepared_message_buffer.clear_msg()
+
         return tool_messages
 
     def reset_call_count(self):
@@ -246,3 +1006,18 @@ class Agent:
         self._call_count = 0
         self.stop = False
         self._reporter.report_metrics("num_resets", 1, mode="add")
+
+    def set_reporter(self, reporter: MDReporter):
+        """
+        Swaps the reporter this agent and its tools log to.
+
+        Lets a long-lived agent be reused across jobs that should land in
+        separate report files, instead of rebuilding agent and tools per
+        job.
+
+        Args:
+            reporter: The reporter to log all further interactions to.
+        """
+        self._reporter = reporter
+        for tool in self._tools:
+            tool.reporter = reporter
@@ -1,8 +1,12 @@
 """
 Code reviewing agent that compares a task and standard requirements with code.
 """
+import collections
+from pathlib import Path
+
 from agents.agent import Agent
 from tools.write_code_review import WriteCodeReview
+from utility.gen_cache import GenCache
 from utility.md_reporter import MDReporter
 
 SYSTEM_PROMPT = """"
@@ -72,6 +76,7 @@ class CodeReviewer(Agent):
         self.task = task
         self.pass_ = False
         self.feedback = ""
+        self._cache = GenCache()
 
     def review(self, path_to_code: str)-> tuple[bool, str]:
         """
@@ -89,19 +94,36 @@ class CodeReviewer(Agent):
             ValueError: The message list is empty.
 
         """
-        with open(path_to_code, "r", encoding="utf-8") as file:
-            code = file.read()
-            print(code)
+        code = Path(path_to_code).read_text(encoding="utf-8")
+
+        #  Structurally identical code under the same task replays the
+        #  cached verdict instead of spending another model call.
+        cache_key = GenCache.make_key(
+            self._agent_name, self._system_prompt, self.task, code)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.pass_, self.feedback = cached
+            self._reporter.report_metrics("review_cache_hits", 1, mode="add")
+            if self.pass_:
+                self._reporter.report_metrics("passed_reviews", 1, mode="add")
+            else:
+                self._reporter.report_metrics("failed_reviews", 1, mode="add")
+            return self.pass_, self.feedback
+
+        #  One message instead of two: the invariant task stays first so the
+        #  prompt prefix is served from the provider's prompt cache across
+        #  successive review cycles; only the code suffix changes.
         messages = [{
             "role": "user",
-            "content": f"Code to be reviewed:\n ```python\n{code}\n```"
-        },
-        {
-            "role": "user",
-            "content": f'The task the code should align with:\n {self.task}'
+            "content": (
+                f"The task the code should align with:\n {self.task}\n\n"
+                f"Code to be reviewed:\n ```python\n{code}\n```"
+            )
         }]
         _ = self.call(messages)
 
+        self._cache.put(cache_key, (self.pass_, self.feedback))
+
         if self.pass_:
             self._reporter.report_metrics("passed_reviews", 1, mode="add")
         else:
@@ -115,4 +137,4 @@ class CodeReviewer(Agent):
         self.pass_ = False
         self.feedback = ""
         self.stop = False
-        self.response_ids = []
+        self.response_ids = collections.deque(maxlen=8)
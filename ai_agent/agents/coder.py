@@ -1,6 +1,8 @@
 """
 Coding agent for simple code requests.
 """
+import threading
+
 from agents.agent import Agent
 from agents.code_reviewer import CodeReviewer
 from tools.write_python import WritePython
@@ -49,7 +51,8 @@ class Coder(Agent):
             work_dir:str,
             reviewer: CodeReviewer,
             reporter: MDReporter,
-            name: str = "Coder"
+            name: str = "Coder",
+            stop_event: threading.Event = None
             ):
         """
         Create coding agent.
@@ -60,13 +63,17 @@ class Coder(Agent):
             name:
                 Name by which the agent can be identified (used in logs),
                 defaults to 'Coder'.
+            stop_event:
+                Event signalling the end of the whole project; once set,
+                the coder refuses further API calls.
         """
         super().__init__(
             model,
             name,
             SYSTEM_PROMPT,
             [WritePython(work_dir, self, reporter, reviewer)],
-            reporter
+            reporter,
+            stop_event=stop_event
             )
 
         self.reviewer = reviewer
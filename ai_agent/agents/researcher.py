@@ -2,26 +2,17 @@
 Researcher agent that can execute small physics/data analyses tasks on its own.
 """
 import json
+from typing import TYPE_CHECKING
 
 from agents.agent import Agent
-from tools.execute_python import ExecutePython
-from tools.view_images import ViewImages
-from tools.end_project import EndProject
-from tools.handoff_to_coder import HandoffToCoder
-from tools.task_tools.add_task import AddTask
-from tools.task_tools.complete_task import CompleteTask
-from tools.task_tools.get_task_info import GetTaskInfo
-from tools.task_tools.get_task_list import GetTaskList
-from tools.task_tools.select_task import SelectTask
-from tools.view_text_files import ViewTextFiles
-from tools.logic_review import LogicReview
-from tools.write_final_report import WriteFinalReport
-from tools.submit_numeric_values import SubmitNumericValues
-from tools.get_feedback import GetFeedback
+from utility.llm_cache import LLMCache
 from utility.prepared_msg_buff import preparedMsgBuff
 from utility.md_reporter import MDReporter
 from utility.task_manager import TaskManager
 
+if TYPE_CHECKING:
+    from tools.end_project import EndProject
+
 
 SYSTEM_PROMPT = """
 You are the best Physics Ai that the whole world has to offer.
@@ -34,6 +25,8 @@ Question asked in the chat will not be answered.
 As you are working on your own, use the chat as notes and for documentation.
 Elaborate your thought process with normal messages.
 Document what you are doing in mark down.
+If multiple independent tool calls are needed (e.g. viewing several
+files), emit them together in one turn instead of one per turn.
 The first message you get will be your task.
 For the fulfillment of the task you can use the following tools:
     1. handoff_to_coder: Use when you need a python program
@@ -95,7 +88,16 @@ For the fulfillment of the task you can use the following tools:
             - if special questions are specified in the tool description, answer them!
             - depending on the project setup this tool might accept a the path to a csv that contains final score and the column name with that score. 
                 check the tool description for what is needed and act accordingly
-    8. end_project: Use to end your project
+    8. run_code_act: Use to fuse several chainable steps into one call
+        - takes a python snippet that you write
+        - use it when your next steps form one plan that does not need new
+          information from you in between, e.g. run a script, read its
+          output files and compute a derived number in one go
+        - read text files and run scripts directly from the snippet
+          (subprocess), print everything you want to see
+        - returns stdout, stderr and a list of newly created files
+        - prefer one run_code_act call over a chain of single tool calls
+    9. end_project: Use to end your project
         - can be used when:
             - your have finished your project successfully and further research is out of reach
             - you cannot finnish your current goal with the tools/data you have
@@ -123,7 +125,7 @@ class Researcher(Agent):
     def __init__(
             self,
             model: str,
-            stop_tool: EndProject,
+            stop_tool: "EndProject",
             task_manager: TaskManager,
             reporter: MDReporter,
             work_dir: str,
@@ -132,7 +134,10 @@ class Researcher(Agent):
             numeric_question_file: str = None,
             name: str = 'Researcher',
             sub_reporter: bool = False,
-            max_calls: int =10
+            max_calls: int =10,
+            llm_cache: LLMCache = None,
+            model_coder: str = None,
+            model_reviewer: str = None
             ):
         """
         Creates a new Researcher.
@@ -153,8 +158,41 @@ class Researcher(Agent):
             sub_reporter: 
                 Wether coders should have their own reporting tool or appear in
                 the main report. Defaults to false -> One report for everything.
-            max_calls: How often the model can be called before emergency stop. 
+            max_calls: How often the model can be called before emergency stop.
+            llm_cache:
+                Persistent cache replaying tool-free calls with identical
+                inputs, caching is disabled if none is provided.
+            model_coder:
+                Name of the OpenAi model used for coders, defaults to the
+                researcher model.
+            model_reviewer:
+                Name of the OpenAi model used for code and logic
+                reviewers, defaults to the researcher model.
         """
+        #  The tool modules pull in heavy transitive imports (pylint via the
+        #  coder chain, pandas via the feedback tool). Importing them here
+        #  keeps module load cheap for users of the other agents.
+        # pylint: disable=import-outside-toplevel
+        from tools.code_act import CodeAct
+        from tools.execute_python import ExecutePython
+        from tools.view_images import ViewImages
+        from tools.handoff_to_coder import HandoffToCoder
+        from tools.task_tools.add_task import AddTask
+        from tools.task_tools.complete_task import CompleteTask
+        from tools.task_tools.get_task_info import GetTaskInfo
+        from tools.task_tools.get_task_list import GetTaskList
+        from tools.task_tools.select_task import SelectTask
+        from tools.view_text_files import ViewTextFiles
+        from tools.logic_review import LogicReview
+        from tools.write_final_report import WriteFinalReport
+        from tools.submit_numeric_values import SubmitNumericValues
+        from tools.get_feedback import GetFeedback
+
+        #  Tool selection, coding and reviewing differ in how much model
+        #  capability they need; routing each role to its own model cuts
+        #  cost on the hottest loops without touching the others.
+        model_coder = model_coder if model_coder else model
+        model_reviewer = model_reviewer if model_reviewer else model
 
         buff = preparedMsgBuff()
         tools = [
@@ -162,8 +200,11 @@ class Researcher(Agent):
             ViewImages(work_dir, buff, reporter),
             ViewTextFiles(work_dir, buff, reporter),
             ExecutePython(work_dir, reporter),
-            HandoffToCoder(work_dir, reporter, model, sub_reporter),
-            LogicReview(model, work_dir, reporter),
+            CodeAct(work_dir, reporter),
+            HandoffToCoder(work_dir, reporter, model_coder, sub_reporter,
+                           stop_event=stop_tool.stop_event,
+                           reviewer_model=model_reviewer),
+            LogicReview(model_reviewer, work_dir, reporter),
             WriteFinalReport(
                 questions_to_be_answered,
                 work_dir,
@@ -201,5 +242,8 @@ class Researcher(Agent):
             tools,
             reporter,
             buff,
-            max_calls=max_calls
+            max_calls=max_calls,
+            llm_cache=llm_cache,
+            echo_stream=True,
+            stop_event=stop_tool.stop_event
             )
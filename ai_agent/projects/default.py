@@ -1,9 +1,12 @@
 import argparse
+import os
 import time
 
 
+from agents.agent import close_shared_clients
 from agents.researcher import Researcher
 from tools.end_project import EndProject
+from utility.llm_cache import LLMCache
 from utility.md_reporter import MDReporter
 from utility.util import make_output_dir
 
@@ -14,7 +17,7 @@ WORK_DIR = "/out/"
 MODEL = "gpt-4o-mini"
 
 
-def main(work_dir: str, prompt_file: str, model: str, question_file: str = None, evaluation_param_file: str = None, numeric_question_file = None, job_number: int = None):
+def main(work_dir: str, prompt_file: str, model: str, question_file: str = None, evaluation_param_file: str = None, numeric_question_file = None, job_number: int = None, model_coder: str = None, model_reviewer: str = None):
 
     start_clock = time.time()
 
@@ -28,7 +31,7 @@ def main(work_dir: str, prompt_file: str, model: str, question_file: str = None,
 
 
 
-    task_manager = TaskManager()
+    task_manager = TaskManager(dir_)
     task = Task(1, "Initial task", prompt, dir_)
     task_manager.add_task(task)
     task_manager.activate_task(1)
@@ -41,7 +44,12 @@ def main(work_dir: str, prompt_file: str, model: str, question_file: str = None,
 
     reporter = MDReporter(dir_)
 
+    model_coder = model_coder if model_coder else model
+    model_reviewer = model_reviewer if model_reviewer else model
+
     reporter.report_metrics("model", model, mode="overwrite")
+    reporter.report_metrics("model_coder", model_coder, mode="overwrite")
+    reporter.report_metrics("model_reviewer", model_reviewer, mode="overwrite")
     reporter.report_metrics("work_dir", dir_, mode="overwrite")
     reporter.report_metrics("prompt_file", prompt_file, mode="overwrite")
     reporter.report_metrics("finished", False, mode="overwrite")
@@ -62,20 +70,53 @@ def main(work_dir: str, prompt_file: str, model: str, question_file: str = None,
                            evaluation_param_file=evaluation_param_file,
                            numeric_question_file=numeric_question_file,
                            sub_reporter=True,
-                           max_calls=75)
-
-    while not stop_tool.stop and not physicist.stop:
-        out_text = physicist.call([message])
-        message["content"] = ""
-        print(out_text)
-
-    task_manager.save_tasks()
+                           max_calls=75,
+                           #  Rooted at the sweep directory, not the run
+                           #  directory: make_output_dir creates a fresh
+                           #  run_N/ per invocation, and a per-run cache
+                           #  could never see a repeated first turn.
+                           llm_cache=LLMCache(
+                               os.path.join(work_dir, ".llm_cache") + "/"),
+                           model_coder=model_coder,
+                           model_reviewer=model_reviewer)
+
+    continue_or_end = """No pending tool results.
+    Continue your plan using tools, or call end_project if you are done."""
+
+    try:
+        #  The researcher echoes its text to stdout while it streams, so
+        #  there is nothing left to print once the call returns.
+        nudged = False
+        while not stop_tool.stop and not physicist.stop:
+            physicist.call([message])
+            if physicist.last_call_had_tool_calls:
+                message["content"] = ""
+                nudged = False
+            elif not nudged:
+                #  A tool-free turn followed by an empty user turn makes
+                #  the model repeat itself; force one explicit
+                #  continue-or-end decision instead.
+                message["content"] = continue_or_end
+                nudged = True
+                reporter.report_metrics(
+                    "forced_decision_turns", 1, mode="add")
+            else:
+                #  Two tool-free turns in a row: the model is idling, so
+                #  stop locally instead of spending the remaining call
+                #  budget on repetition.
+                reporter.report_metrics("skipped_llm_calls", 1, mode="add")
+                reporter.report_metrics("stalled", True, mode="overwrite")
+                break
+    finally:
+        task_manager.save_tasks()
+        close_shared_clients()
 
 
     end_clock = time.time()
     reporter.report_completion_time((end_clock - start_clock) / 60)
     reporter.report_metrics("completion_time", (end_clock - start_clock) / 60, mode="overwrite")
     reporter.report_metrics("finished", True, mode="overwrite")
+    reporter.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -90,7 +131,15 @@ if __name__ == "__main__":
 
     parser.add_argument("--model", type=str, default=MODEL,
                         help="Model to use for the AI.")
-    
+
+    parser.add_argument("--model_coder", type=str, default=None,
+                        help="""Model to use for the coders.
+                        Defaults to the researcher model.""")
+
+    parser.add_argument("--model_reviewer", type=str, default=None,
+                        help="""Model to use for code and logic reviewers.
+                        Defaults to the researcher model.""")
+
     parser.add_argument("--question_file", type=str, default=None,
                         help="""Questions file containing questions
                         the AI should answer. Each line is one question
@@ -110,5 +159,5 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    main(args.work_dir, args.prompt_file, args.model, args.question_file, args.evaluation_param_file, numeric_question_file=args.numeric_questions_file,job_number=args.job_number)
+    main(args.work_dir, args.prompt_file, args.model, args.question_file, args.evaluation_param_file, numeric_question_file=args.numeric_questions_file,job_number=args.job_number, model_coder=args.model_coder, model_reviewer=args.model_reviewer)
 
@@ -0,0 +1,162 @@
+"""
+Tool that lets the agent run a multi-step plan as a single python snippet.
+"""
+import os
+import resource
+import subprocess
+import time
+
+from tools.tool import Tool
+from utility.fs_snapshot import changed_files, snapshot
+from utility.md_reporter import MDReporter
+
+TIMEOUT_SECONDS = 300
+MEMORY_LIMIT_BYTES = 4 * 1024 ** 3
+
+
+def _limit_resources():
+    """
+    Applies resource limits to the snippet subprocess.
+
+    Caps CPU time and address space as a lightweight sandbox substitute,
+    so a runaway snippet cannot stall or exhaust the agent process.
+    """
+    resource.setrlimit(resource.RLIMIT_CPU,
+                       (TIMEOUT_SECONDS, TIMEOUT_SECONDS))
+    resource.setrlimit(resource.RLIMIT_AS,
+                       (MEMORY_LIMIT_BYTES, MEMORY_LIMIT_BYTES))
+
+
+class CodeAct(Tool):
+    """
+    Tool that executes a python snippet fusing several steps into one call.
+
+    Instead of one model turn per micro-tool (view a file, run a script,
+    check its output), the agent can express a chainable plan as one python
+    block. File reads, program invocations and small computations happen
+    natively in the snippet, collapsing O(steps) model turns into one.
+
+    Attributes:
+        work_dir:
+            The directory the snippet is saved to and executed in.
+        name:
+            The name of the tool.
+        schema:
+            The schema defining the tool's parameters and return type.
+        function:
+            The function that implements the tool's functionality has to
+            return a string containing the result readable for a LLM.
+        reporter:
+            An instance of MDReporter for reporting metrics.
+    """
+    def __init__(self, work_dir: str, reporter: MDReporter):
+        """
+        Initializes the CodeAct tool.
+
+        Args:
+            work_dir:
+                The directory the snippet is saved to and executed in.
+            reporter:
+                The reporter to log the execution results.
+        """
+        name = 'run_code_act'
+        schema = Tool.build_function_schema(
+            name,
+            """
+            Executes a python snippet that combines several steps of your
+            plan into one call (read files, run previously created scripts
+            via subprocess, compute and print intermediate results).
+            Use this instead of several single tool calls when the steps are
+            chainable. Print everything you want to see; stdout and stderr
+            are returned together with a list of newly created files.
+            """,
+            [
+                Tool.build_parameter_schema(
+                    'code',
+                    'The python snippet to execute.',
+                    'string'
+                )
+            ]
+        )
+
+        super().__init__(name, schema, self.run_code_act, reporter)
+        self.work_dir = work_dir
+        self._save_env = False
+        if os.environ.get('SAVE_EXECUTION_ENV') == 'True':
+            self._save_env = True
+        self._counter = 0
+
+    def run_code_act(self, code: str) -> str:
+        """
+        Saves the snippet to the work directory and executes it.
+
+        Args:
+            code: The python snippet to execute.
+
+        Returns:
+            A message with newly created files, program output, error output
+            and exit status.
+        """
+        filename = f'code_act_{self._counter}.py'
+        self._counter += 1
+        path = self.work_dir + filename
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(code)
+
+        pre_snapshot = snapshot(self.work_dir)
+
+        if not self._save_env:
+            print('Execute ' + path + ' as follows: python ' + path)
+            print('enter on execution . . . ')
+            input()
+            output = ''
+            error_output = ''
+            exit_status = 0
+        else:
+            start_clock = time.time()
+            try:
+                result = subprocess.run(
+                    ['python', filename],
+                    cwd=self.work_dir,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=TIMEOUT_SECONDS,
+                    preexec_fn=_limit_resources
+                )
+                output = result.stdout
+                error_output = result.stderr
+                exit_status = result.returncode
+            except subprocess.TimeoutExpired:
+                output = ''
+                error_output = (f'Snippet timed out after {TIMEOUT_SECONDS}'
+                                ' seconds.')
+                exit_status = -1
+            end_clock = time.time()
+            self.reporter.report_metrics(
+                'code_act_time',
+                (end_clock - start_clock),
+                mode='add'
+            )
+
+            if exit_status != 0:
+                self.reporter.report_metrics('code_act_error', 1, mode='add')
+
+        new_files = changed_files(pre_snapshot, snapshot(self.work_dir))
+
+        message = 'The following files were created: ' + str(new_files)
+
+        if new_files:
+            self.reporter.report_metrics(
+                'new_files_created',
+                len(new_files),
+                mode='add'
+                )
+
+        if self._save_env:
+            message += '\n Program output: \n' + output \
+                + '\n Error output: \n' + error_output \
+                + '\n Exit status: ' + str(exit_status)
+
+        return message
@@ -1,6 +1,8 @@
 """
 Tool that allows the agent to end the project with a reason.
 """
+import threading
+
 from tools.tool import Tool
 from utility.md_reporter import MDReporter
 
@@ -10,8 +12,12 @@ class EndProject(Tool):
     Extends the Tool class.
     
     Attributes:
+        stop_event:
+            Event that is set once the project has been marked as
+            finished. Shared with agents so concurrently running
+            branches stop spending call budget immediately.
         stop:
-            A boolean indicating whether the project has been marked as 
+            A boolean indicating whether the project has been marked as
             finished.
         name:
             The name of the tool.
@@ -23,6 +29,9 @@ class EndProject(Tool):
         reporter:
             An instance of MDReporter for reporting metrics.
     """
+
+    terminal = True
+
     def __init__(self, reporter: MDReporter):
         """
         Initializes the EndProject tool.
@@ -46,8 +55,14 @@ class EndProject(Tool):
             [parameter_reason]
         )
         super().__init__(self.name, schema, self.end_project, reporter)
-        self.stop = False
+        self.stop_event = threading.Event()
 
+    @property
+    def stop(self) -> bool:
+        """
+        Whether the project has been marked as finished.
+        """
+        return self.stop_event.is_set()
 
     def end_project(self, reason: str) -> str:
         """
@@ -61,5 +76,5 @@ class EndProject(Tool):
             the provided reason.
         """
 
-        self.stop = True
+        self.stop_event.set()
         return 'The project was finished with the following reason: ' + reason
@@ -1,14 +1,42 @@
 """
 Tool that allows the agent to execute a python file in the specified directory.
 """
+import collections
 import os
-import glob
+import shlex
 import subprocess
+import threading
 import time
 
 from tools.tool import Tool
+from utility.fs_snapshot import changed_files, snapshot
 from utility.md_reporter import MDReporter
 
+#  Only the tail of each output stream is kept; training scripts can log
+#  far more than the model should (or could) ever see.
+_TAIL_CHUNK_SIZE = 8192
+_TAIL_CHUNKS = 8
+
+
+def _pump(stream, tail: collections.deque):
+    """
+    Drains a subprocess pipe into a bounded tail buffer.
+
+    Reading continuously keeps the child from blocking on a full pipe;
+    the deque drops the oldest chunks so memory stays bounded.
+
+    Args:
+        stream: Binary pipe of the child process.
+        tail: Deque with maxlen collecting the most recent chunks.
+    """
+    while True:
+        chunk = stream.read(_TAIL_CHUNK_SIZE)
+        if not chunk:
+            break
+        tail.append(chunk)
+    stream.close()
+
+
 class ExecutePython(Tool):
     """
     Tool for executing a python file in a specified directory.
@@ -65,10 +93,72 @@ class ExecutePython(Tool):
         )
 
         super().__init__(name, schema, self.execute_python, reporter)
-        self.work_dir = work_dir
+        self.work_dir = os.path.normpath(work_dir) + os.sep
         self._save_env  = False
         if os.environ.get('SAVE_EXECUTION_ENV') == 'True':
             self._save_env = True
+        self._timeout = float(os.environ.get('EXECUTE_PYTHON_TIMEOUT', '1800'))
+
+        #  With PYTHON_WORKER_POOL=N scripts run on N persistent workers
+        #  that have the heavy analysis imports already loaded, instead of
+        #  paying interpreter startup per execution.
+        self._pool = None
+        pool_size = int(os.environ.get('PYTHON_WORKER_POOL', '0'))
+        if pool_size > 0 and self._save_env:
+            # pylint: disable=import-outside-toplevel
+            from utility.py_worker_pool import PyWorkerPool
+            self._pool = PyWorkerPool(pool_size)
+
+    def _run_streamed(self, cmd: list[str]) -> tuple[str, str, int]:
+        """
+        Runs a command while streaming its output into bounded buffers.
+
+        Unlike subprocess.run with capture_output, the streams are drained
+        as the child produces them, so memory stays bounded for chatty
+        scripts and the pipes never fill up and stall the child. Scripts
+        exceeding the timeout (EXECUTE_PYTHON_TIMEOUT seconds) are killed
+        instead of stalling the agent loop forever.
+
+        Args:
+            cmd: The command and its arguments.
+
+        Returns:
+            Tuple of stdout tail, stderr tail and exit status.
+        """
+        with subprocess.Popen(
+                cmd,
+                cwd=self.work_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+                ) as proc:
+            out_tail = collections.deque(maxlen=_TAIL_CHUNKS)
+            err_tail = collections.deque(maxlen=_TAIL_CHUNKS)
+            pumps = [
+                threading.Thread(
+                    target=_pump, args=(proc.stdout, out_tail), daemon=True),
+                threading.Thread(
+                    target=_pump, args=(proc.stderr, err_tail), daemon=True),
+            ]
+            for pump in pumps:
+                pump.start()
+
+            try:
+                exit_status = proc.wait(timeout=self._timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                exit_status = proc.wait()
+                self.reporter.report_metrics(
+                    'execute_python_timeout', 1, mode='add')
+                err_tail.append(
+                    f'\nExecution killed after {self._timeout}s timeout'
+                    .encode())
+
+            for pump in pumps:
+                pump.join()
+
+        output = b''.join(out_tail).decode(errors='replace')
+        error_output = b''.join(err_tail).decode(errors='replace')
+        return output, error_output, exit_status
 
     def execute_python(self, filename: str, cli_args: str) -> str:
         """
@@ -84,19 +174,23 @@ class ExecutePython(Tool):
             including any new files created, program output, error output
             and exit status.
         """
-        path = self.work_dir + filename + '.py'
+        path = os.path.join(self.work_dir, filename + '.py')
 
-        current_files = glob.glob('**', root_dir=self.work_dir, recursive=True)
+        pre_snapshot = snapshot(self.work_dir)
 
         if self._save_env:
             start_clock = time.time()
-            result = subprocess.run(
-                ['python', filename] + cli_args.split(' '),
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            #  shlex honors quoting and does not produce empty arguments
+            #  for repeated spaces, both of which made naive splitting
+            #  fail scripts (and cost another model round to retry).
+            args = shlex.split(cli_args)
+            if self._pool is not None:
+                output, error_output, exit_status = self._pool.run(
+                    filename, args, self.work_dir, self._timeout)
+            else:
+                output, error_output, exit_status = self._run_streamed(
+                    ['python', filename] + args
+                )
             end_clock = time.time()
             self.reporter.report_metrics(
                 'execution_time',
@@ -104,10 +198,6 @@ class ExecutePython(Tool):
                 mode='add'
             )
 
-            output = result.stdout
-            error_output = result.stderr
-            exit_status = result.returncode
-
             if exit_status != 0:
                 self.reporter.report_metrics(
                     'execute_python_error',
@@ -122,11 +212,7 @@ class ExecutePython(Tool):
             print('enter on execution . . . ')
             input()
 
-        new_files = []
-
-        for f in glob.glob('**', root_dir=self.work_dir, recursive=True):
-            if f not in current_files:
-                new_files.append(f)
+        new_files = changed_files(pre_snapshot, snapshot(self.work_dir))
 
         message = 'The following files were created: ' + str(new_files)
 
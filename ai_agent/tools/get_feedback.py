@@ -1,7 +1,10 @@
-""" 
+"""
 A tool that allows the Agent to get feedback on the scores it has generated.
 """
+import hashlib
+import json
 import os
+import shutil
 
 from tools.tool import Tool
 from utility.md_reporter import MDReporter
@@ -10,6 +13,24 @@ from utility.evaluation_functions import evaluate_scores
 import pandas as pd
 
 SCORE_FILE_NAME = 'scores.csv'
+PLOT_FILES = ('background_rejection_curve.png', 'sic_curve.png')
+
+
+def _file_sha256(path: str) -> str:
+    """
+    Hashes a file's content in streamed chunks.
+
+    Args:
+        path: Path of the file to hash.
+
+    Returns:
+        The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 class GetFeedback(Tool):
     """
@@ -33,6 +54,11 @@ class GetFeedback(Tool):
             An instance of MDReporter for reporting metrics.
     """
 
+    #  Round directories are numbered from a shared counter and the
+    #  in-thread evaluation path drives matplotlib, which is not
+    #  thread-safe; two parallel calls would share one r_N/ directory
+    #  and corrupt each other's plots and archived scores.
+    concurrent = False
 
     def __init__(self,
                  work_dir: str,
@@ -66,8 +92,8 @@ class GetFeedback(Tool):
         parameter_score_file = Tool.build_parameter_schema(
             'score_file',
             """
-            The file containing evaluation scores to be checked,
-            first column needs to be index column.
+            The file containing evaluation scores to be checked
+            (CSV or Parquet), first column needs to be index column.
             File needs to be sorted by index
             """,
             'string'
@@ -94,6 +120,72 @@ class GetFeedback(Tool):
 
         self.work_dir = work_dir if work_dir.endswith('/') else work_dir + '/'
         self.counter = 0
+        #  Resubmitting an unchanged score file during iterative tuning is
+        #  common; cached results keyed on the file contents skip the whole
+        #  pandas/sklearn/matplotlib pass on repeats.
+        self._cache_dir = self.work_dir + '.feedback_cache/'
+
+    def _cache_key(self, score_file: str, score_col: str) -> str | None:
+        """
+        Builds a cache key from the score file, column and eval config.
+
+        Args:
+            score_file: Name of the score file in the work directory.
+            score_col: Column in the score file holding the scores.
+
+        Returns:
+            The hex key or None if one of the files cannot be hashed.
+        """
+        try:
+            return hashlib.sha256((
+                _file_sha256(self.work_dir + score_file)
+                + score_col
+                + _file_sha256(self.eval_file)
+            ).encode('utf-8')).hexdigest()
+        except OSError:
+            return None
+
+    def _cache_load(self, cache_key: str, directory: str) -> tuple | None:
+        """
+        Loads cached metrics and replays the cached plots.
+
+        Args:
+            cache_key: Key built by _cache_key.
+            directory: Feedback round directory receiving the plot copies.
+
+        Returns:
+            Tuple of auc, max sic and tpr at max sic, or None on a miss.
+        """
+        entry_dir = self._cache_dir + cache_key + '/'
+        try:
+            with open(entry_dir + 'metrics.json', 'r', encoding='utf-8') as f:
+                metrics = json.load(f)
+            for plot in PLOT_FILES:
+                shutil.copyfile(entry_dir + plot, directory + plot)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return metrics['auc'], metrics['max_sic'], metrics['tpr_max_sic']
+
+    def _cache_store(self, cache_key: str, directory: str, metrics: tuple):
+        """
+        Stores metrics and plots of a feedback round in the cache.
+
+        Args:
+            cache_key: Key built by _cache_key.
+            directory: Feedback round directory holding the fresh plots.
+            metrics: Tuple of auc, max sic and tpr at max sic.
+        """
+        entry_dir = self._cache_dir + cache_key + '/'
+        auc, m_sic, tpr_ms = metrics
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            for plot in PLOT_FILES:
+                shutil.copyfile(directory + plot, entry_dir + plot)
+            with open(entry_dir + 'metrics.json', 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'auc': auc, 'max_sic': m_sic, 'tpr_max_sic': tpr_ms}, f)
+        except OSError as e:
+            print(f'Feedback cache write failed: {e}')
 
     def get_feedback(self, score_file: str, score_col: str) -> str:
         """
@@ -116,35 +208,66 @@ class GetFeedback(Tool):
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-        try:
-            score_df = pd.read_csv(self.work_dir + score_file)
-            if score_col not in score_df.columns:
-                return f"""
+        cache_key = self._cache_key(score_file, score_col)
+        cached = self._cache_load(cache_key, directory) if cache_key else None
+
+        if cached is not None:
+            auc, m_sic, tpr_ms = cached
+            self.reporter.report_metrics('feedback_cache_hits', 1, mode='add')
+        else:
+            try:
+                #  The pyarrow engine parses large score files
+                #  multi-threaded; fall back to the default C engine where
+                #  it is unavailable. Parquet input skips CSV parsing
+                #  entirely.
+                if score_file.endswith('.parquet'):
+                    score_df = pd.read_parquet(self.work_dir + score_file)
+                else:
+                    try:
+                        score_df = pd.read_csv(
+                            self.work_dir + score_file,
+                            engine='pyarrow',
+                            dtype_backend='pyarrow'
+                        )
+                    except (ImportError, ValueError):
+                        score_df = pd.read_csv(self.work_dir + score_file)
+                if score_col not in score_df.columns:
+                    return f"""
                 Column '{score_col}' not found in the score file '{score_file}'.
                 """
-        except Exception as e:
-            self.reporter.report_metrics('feedback_error', 1, mode='add')
-            return f'The score file "{score_file}" could not be read: {e}'
+            except Exception as e:
+                self.reporter.report_metrics('feedback_error', 1, mode='add')
+                return f'The score file "{score_file}" could not be read: {e}'
 
-        score_df.to_csv(directory + SCORE_FILE_NAME)
+            #  Copy the validated file byte for byte instead of paying a
+            #  parse -> format roundtrip through the dataframe. The
+            #  archive keeps the input's format so the evaluation reader
+            #  picks the right parser.
+            archive_name = 'scores.parquet' \
+                if score_file.endswith('.parquet') else SCORE_FILE_NAME
+            shutil.copyfile(
+                self.work_dir + score_file, directory + archive_name)
 
-        auc = None
-        m_sic = None
-        tpr_ms = None
-        try:
-            auc, m_sic, tpr_ms = evaluate_scores(directory, SCORE_FILE_NAME,
-                                             score_col, self.eval_file)
-        except TypeError:
-            self.reporter.report_metrics('feedback_error', 1, mode='add')
-
-        if auc is None:
-            self.reporter.report_metrics('feedback_error', 1, mode='add')
-            return """
+            auc = None
+            m_sic = None
+            tpr_ms = None
+            try:
+                auc, m_sic, tpr_ms = evaluate_scores(
+                    directory, archive_name, score_col, self.eval_file)
+            except TypeError:
+                self.reporter.report_metrics('feedback_error', 1, mode='add')
+
+            if auc is None:
+                self.reporter.report_metrics('feedback_error', 1, mode='add')
+                return """
             Error evaluating scores. Please check the score file and labels.
             Ensure the score file is a CSV file containing a score for every
             index in the label file, sorted by index.
             """
 
+            if cache_key:
+                self._cache_store(cache_key, directory, (auc, m_sic, tpr_ms))
+
         self.reporter.report_metrics('auc_feedback', auc, mode='append')
         self.reporter.report_metrics('max_sic_feedback', m_sic, mode='append')
         self.reporter.report_metrics('tpr_max_sic_feedback',
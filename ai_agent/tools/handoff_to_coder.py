@@ -1,6 +1,8 @@
 """
 Tool that allows to handoff a coding task to a python code writing AI.
 """
+import threading
+
 from tools.tool import Tool
 from agents.coder import Coder
 from agents.code_reviewer import CodeReviewer
@@ -19,8 +21,8 @@ class HandoffToCoder(Tool):
         sub_reporter:
             If True, a new MDReporter instance is created for each coder.
         coders:
-            A list of coders that have been created, each with an ID and a Coder
-            instance.
+            A dict mapping coder IDs to the Coder instances that have been
+            created.
         name:
             The name of the tool.
         schema:
@@ -41,13 +43,15 @@ class HandoffToCoder(Tool):
             work_dir: str,
             reporter: MDReporter,
             model: str,
-            sub_reporter: bool = False
+            sub_reporter: bool = False,
+            stop_event: threading.Event = None,
+            reviewer_model: str = None
             ):
         """
         Initializes the HandoffToCoder tool.
 
         Args:
-            work_dir: 
+            work_dir:
                 The directory in which the code is saved and executed.
             reporter:
                 The reporter to log interactions.
@@ -55,6 +59,12 @@ class HandoffToCoder(Tool):
                 The LLM model used for the coder.
             sub_reporter:
                 If True, a new MDReporter instance is created for each coder.
+            stop_event:
+                Event signalling the end of the whole project; handed to
+                every coder so running handoffs stop immediately.
+            reviewer_model:
+                The LLM model used for the code reviewers, defaults to
+                the coder model.
         """
         name = 'handoff_to_coder'
 
@@ -98,8 +108,15 @@ class HandoffToCoder(Tool):
         self.work_dir = work_dir
         self.reporter = reporter
         self.model = model
-        self.coders = []
+        self.reviewer_model = reviewer_model if reviewer_model else model
+        #  Handoffs to different coder ids run concurrently on the agents
+        #  tool executor. The registry lock guards coder creation, the
+        #  per-coder locks serialize handoffs to the same coder.
+        self.coders = {}
+        self._registry_lock = threading.Lock()
+        self._coder_locks = {}
         self.sub_reporter = sub_reporter
+        self._stop_event = stop_event
 
     def handoff_to_coder(self, task, coder_id):
         """
@@ -117,38 +134,42 @@ class HandoffToCoder(Tool):
             The response from the coder, including a introduction how the
             program can be used.
         """
-        coder: Coder = None
-        for c in self.coders:
-            if c['id'] == coder_id:
-                coder = c['coder']
-                coder.reviewer.task = task
-                coder.reset_call_count()
-                coder.reviewer.reset_call_count()
+        with self._registry_lock:
+            coder: Coder = self.coders.get(coder_id)
+            is_new = coder is None
 
-        if coder is None:
-            if self.sub_reporter:
-                reporter = MDReporter(
+            if is_new:
+                if self.sub_reporter:
+                    reporter = MDReporter(
+                        self.work_dir,
+                        filename=f'conversation_coder_{str(coder_id)}'
+                        )
+                else:
+                    reporter = self.reporter
+                reviewer = CodeReviewer(self.reviewer_model, task, reporter)
+                coder = Coder(
+                    self.model,
                     self.work_dir,
-                    filename=f'conversation_coder_{str(coder_id)}'
+                    reviewer,
+                    reporter,
+                    name=f"Coder {str(coder_id)}",
+                    stop_event=self._stop_event
                     )
-            else:
-                reporter = self.reporter
-            reviewer = CodeReviewer(self.model, task, reporter)
-            coder =  Coder(
-                self.model,
-                self.work_dir,
-                reviewer,
-                reporter,
-                name=f"Coder {str(coder_id)}"
-                )
-            self.coders.append({'id': coder_id, 'coder': coder})
+                self.coders[coder_id] = coder
+                self._coder_locks[coder_id] = threading.Lock()
 
-            self.reporter.report_metrics('different_coders', 1, mode='add')
+                self.reporter.report_metrics('different_coders', 1, mode='add')
 
         message = {
             'role': 'user',
             'content': task
         }
 
-        response = coder.call([message])
+        with self._coder_locks[coder_id]:
+            if not is_new:
+                coder.reviewer.task = task
+                coder.reset_call_count()
+                coder.reviewer.reset_call_count()
+
+            response = coder.call([message])
         return response
@@ -1,6 +1,7 @@
 """
-Tool that allows to review statements based on provide program outputs. 
+Tool that allows to review statements based on provide program outputs.
 """
+import glob
 import os
 
 from tools.tool import Tool
@@ -30,6 +31,11 @@ class LogicReview(Tool):
         logic_review(statement: str) -> str:
             Requests the review of a statement based on program outputs.
     """
+
+    #  Reviews share one reviewer agent; running them concurrently would
+    #  interleave their conversations.
+    concurrent = False
+
     def __init__(self, model, work_dir: str, reporter: MDReporter):
         """
         Initializes the LogicReview tool.
@@ -64,11 +70,22 @@ class LogicReview(Tool):
         super().__init__(name, schema, self.logic_review, reporter)
         self.model = model
         self.work_dir = work_dir
+        self._reviewer = None
+        self._reporter = None
+        #  One scan at construction instead of an os.path.exists walk per
+        #  review; the counter lives in memory afterwards.
+        existing = glob.glob(os.path.join(work_dir, 'logic_review_*.md'))
+        indices = []
+        for path in existing:
+            stem = os.path.basename(path)[len('logic_review_'):-len('.md')]
+            if stem.isdigit():
+                indices.append(int(stem))
+        self._counter = max(indices, default=-1) + 1
 
     def logic_review(self, statement: str) -> str:
         """
         Requests the review of a statement based on program outputs.
-        
+
         Args:
             statement:
                 The statement to be reviewed, include relevant filenames that
@@ -76,23 +93,31 @@ class LogicReview(Tool):
         Returns:
             A string containing the result of the review, readable for a LLM.
         """
-        i = 0
-        while os.path.exists(
-            os.path.join(self.work_dir, f'logic_review_{i}.md')
-            ):
-            i += 1
+        #  MDReporter appends the .md extension itself; passing it here as
+        #  well produced logic_review_N.md.md files before.
+        filename = f'logic_review_{self._counter}'
+        self._counter += 1
 
-        filename = f'logic_review_{i}.md'
-        reviewer = LogicReviewer(
-            self.model,
-            MDReporter(self.work_dir, filename=filename),
-            self.work_dir)
+        #  The reviewer agent is built once and reused; only its report
+        #  file changes per review and its state is reset so every
+        #  statement is judged fresh.
+        reporter = MDReporter(self.work_dir, filename=filename)
+        if self._reviewer is None:
+            self._reviewer = LogicReviewer(self.model, reporter, self.work_dir)
+        else:
+            #  The previous review's file is finished; retire its
+            #  reporter before swapping in the new one.
+            self._reporter.close()
+            self._reviewer.set_reporter(reporter)
+            self._reviewer.reset_call_count()
+            self._reviewer.response_ids.clear()
+        self._reporter = reporter
 
         message = {
             "role": "user",
             "content": statement,
         }
 
-        feedback = reviewer.call([message])
+        feedback = self._reviewer.call([message])
 
         return feedback
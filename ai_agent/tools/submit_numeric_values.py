@@ -3,6 +3,15 @@ Tool that allows the Agent to submit numeric values for questions.
 """
 import json
 
+#  orjson parses the question file noticeably faster than the stdlib;
+#  fall back transparently where it is not installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 from tools.tool import Tool
 from utility.md_reporter import MDReporter
 
@@ -47,7 +56,7 @@ class SubmitNumericValues(Tool):
         name = 'submit_numeric_values'
 
         with open(expected_values_file, 'r', encoding='utf-8') as f:
-            d = json.load(f)
+            d = _json_loads(f.read())
 
         parameters = []
 
@@ -68,6 +77,6 @@ class SubmitNumericValues(Tool):
         super().__init__(name, schema, self.submit_numeric_value, reporter)
 
     def submit_numeric_value(self, **kwargs: float):
-        for k, val in kwargs.items():
-            self.reporter.report_metrics(k,val, mode='overwrite')
+        #  One batched report instead of one snapshot write per value.
+        self.reporter.report_metrics_batch(kwargs, mode='overwrite')
         return 'Values successfully submitted'
@@ -3,6 +3,8 @@ from utility.task_manager import TaskManager
 from utility.md_reporter import MDReporter
 
 class CompleteTask(Tool):
+    terminal = True
+
     def __init__(self, task_manager: TaskManager, reporter: MDReporter):
         name = "complete_task"
         parameter_report = Tool.build_parameter_schema(
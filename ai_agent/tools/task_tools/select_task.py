@@ -39,13 +39,16 @@ class SelectTask(Tool):
         except ValueError:
             return "The task ID must be an integer."
 
+        #  Validate the target first so a typo in new_id does not tear
+        #  down the active task for nothing; the selection either fully
+        #  happens or leaves the current task untouched.
+        if self.task_manager.get_task(new_id) is None:
+            return "Task not found."
+
         if self.task_manager.active_task != -1:
             out += '\n' + self.task_manager.deactivate_task(self.task_manager.active_task, comment)
 
-        for task in self.task_manager.tasks:
-            if task.task_id == new_id:
-                return out + '\n' + self.task_manager.activate_task(new_id)
-        return out + '\n' + "Task not found."
+        return out + '\n' + self.task_manager.activate_task(new_id)
 
 
 
@@ -1,10 +1,51 @@
 """
 Base class for tools used by the AI agent.
 """
+import json
 from typing import Callable
 
+#  orjson serializes the schema dicts several times faster than the
+#  stdlib; fall back transparently where it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from utility.md_reporter import MDReporter
 
+
+def _dumps_canonical(obj) -> str:
+    """
+    Serializes an object to JSON with sorted keys.
+
+    Sorted keys give a byte-stable rendering, which both the schema
+    cache key and the provider prompt cache rely on.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The canonical JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True)
+
+
+def _loads(text: str):
+    """
+    Parses a JSON string with the fastest available parser.
+
+    Args:
+        text: The JSON string to parse.
+
+    Returns:
+        The parsed object.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 class Tool:
     """
     Base class for tools used by the AI agent.
@@ -19,7 +60,19 @@ class Tool:
             return a string containing the result readable for a LLM.
         reporter:
             An instance of MDReporter for reporting metrics.
+        concurrent:
+            Whether the tool is safe to run concurrently with other tool
+            calls. Tools with shared mutable state should set this to False
+            so the agent executes them serially.
+        terminal:
+            Whether running the tool completes the current agent call.
+            Terminal tools end the tool loop instead of provoking another
+            model turn against the call budget.
     """
+
+    concurrent = True
+    terminal = False
+
     def __init__(
             self,
             name: str,
@@ -58,6 +111,10 @@ class Tool:
         self.reporter.report_metrics(f"tool_calls_{self.name}", 1, mode="add")
         return self.function(**parameters)
 
+    #  Parameter schemas are just as static as function schemas and get
+    #  rebuilt for every tool instance; identical inputs share one dict.
+    _parameter_cache = {}
+
     @staticmethod
     def build_parameter_schema(
         name: str,
@@ -70,6 +127,9 @@ class Tool:
         """
         Builds a parameter schema for the tool.
 
+        Identical calls return the same cached schema object; schemas are
+        treated as read-only after construction.
+
         Args:
             name:
                 The name of the parameter.
@@ -87,6 +147,12 @@ class Tool:
         Returns:
             A dictionary representing the parameter schema.
         """
+        cache_key = (name, description, type_, array, required,
+                     tuple(enum) if enum else None)
+        cached = Tool._parameter_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if array:
             items = type_
             type_ = "array"
@@ -109,8 +175,15 @@ class Tool:
                 "type": items
             }
 
+        Tool._parameter_cache[cache_key] = schema
         return schema
 
+    #  Schemas are static per tool configuration but get rebuilt on every
+    #  tool construction (each coder builds its own tool set). The cache
+    #  returns the already-built schema for identical inputs; schemas are
+    #  treated as read-only after construction.
+    _schema_cache = {}
+
     @staticmethod
     def build_function_schema(
         name: str,
@@ -119,6 +192,9 @@ class Tool:
         ):
         """ Builds a function schema for the tool.
 
+        Identical calls return the same cached schema object, so repeated
+        agent construction does not re-serialize unchanged schemas.
+
         Args:
             name:
                 The name of the function.
@@ -130,10 +206,19 @@ class Tool:
         Returns:
             A dictionary representing the function schema.
         """
+        cache_key = _dumps_canonical([name, description, parameters])
+        cached = Tool._schema_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        #  One pass collects both the merged properties and the names;
+        #  next(iter(p)) reads the single key without materializing a
+        #  list for it.
         parameter_dict = {}
+        parameter_names = []
         for p in parameters:
             parameter_dict.update(p)
-        parameter_names = [list(p.keys())[0] for p in parameters]
+            parameter_names.append(next(iter(p)))
         schema = {
                 "type": "function",
                 "name": name,
@@ -146,4 +231,9 @@ class Tool:
                 },
                 "strict": True
             }
+        #  Round-trip with sorted keys so the schema serializes
+        #  byte-identically on every call. Providers only reuse cached
+        #  prompt prefixes when the static blocks never drift.
+        schema = _loads(_dumps_canonical(schema))
+        Tool._schema_cache[cache_key] = schema
         return schema
@@ -5,6 +5,11 @@ from tools.tool import Tool
 from utility.prepared_msg_buff import preparedMsgBuff
 from utility.md_reporter import MDReporter
 
+#  Only 2000 characters are ever shown; reading at most this many bytes
+#  comfortably covers the cap (UTF-8 uses up to 4 bytes per character)
+#  without materializing multi-MB logs just to throw them away.
+_READ_LIMIT = 8192
+
 
 class ViewTextFiles(Tool):
     def __init__(self, work_dir: str, prepared_message_buffer: preparedMsgBuff, reporter: MDReporter):
@@ -31,51 +36,61 @@ class ViewTextFiles(Tool):
         self.prepared_message_buffer = prepared_message_buffer
         self.reporter = reporter
 
-    def view_txt(self, filename: str, txt_msg_list:str) -> tuple[str, bool]:
+    def view_txt(self, filename: str, chunks: list[str]) -> bool:
         path = self.work_dir + filename
-        if not os.path.isfile(path):
-            return txt_msg_list, False, 
-        
-        ext = filename.split('.')[-1]
-        
-        txt = ''
-        with open(path, "r") as file:
+
+        #  Opening directly instead of stat-then-open saves a syscall per
+        #  file and has no gap between check and use.
+        try:
+            with open(path, "rb") as file:
+                raw = file.read(_READ_LIMIT)
+                #  One extra byte tells whether the file continues past
+                #  the limit without reading the rest of it.
+                more = file.read(1)
+        except OSError:
+            return False
+
+        if b'\x00' in raw:
+            txt = "File could not be read as text, possibly binary or unsupported encoding."
+            self.reporter.report_metrics("view_text_files_error", 1, mode="add")
             app = False
-            try:
-                txt = file.read()
-                app = True
-            except UnicodeDecodeError:
-                txt = "File could not be read as text, possibly binary or unsupported encoding."
-                self.reporter.report_metrics("view_text_files_error", 1, mode="add")
-                app = False
-
-            if len(txt) > 2000:
+        else:
+            txt = raw.decode("utf-8", errors="replace")
+            app = True
+
+            if len(txt) > 2000 or more:
                 txt = txt[:2000] + '...\n \n FILE TO LARGE TO DISPLAY IN FULL'
                 self.reporter.report_metrics("view_text_files_truncated", 1, mode="add")
 
-        txt_msg_list += f"## {filename}\n \n {txt}\n\n\n" 
+        chunks.append(f"## {filename}\n \n {txt}\n\n\n")
 
         self.reporter.report_text(txt, filename)
 
-        return txt_msg_list, app
+        return app
 
     def view_text_files(self, filenames: list[str]) -> str:
-        txt_msg_list = ''
+        #  Collecting the pieces and joining once keeps concatenation
+        #  linear; repeated += across the view_txt call boundary degrades
+        #  to quadratic copying as the contents accumulate.
+        chunks = []
         success = []
         failure = []
         for fn in filenames:
-            txt_msg_list, appended = self.view_txt(fn, txt_msg_list)
-            if appended:
+            if self.view_txt(fn, chunks):
                 success.append(fn)
             else:
                 failure.append(fn)
         txt_msg = {
             "role": "user",
-            "content": txt_msg_list 
+            "content": ''.join(chunks)
         }
 
-        self.reporter.report_metrics("view_text_files_success", len(success), mode="add")
-        self.reporter.report_metrics("view_text_files_failure", len(failure), mode="add")
+        #  One batched update applies both counters under a single
+        #  reporter round trip instead of two.
+        self.reporter.report_metrics_batch({
+            "view_text_files_success": len(success),
+            "view_text_files_failure": len(failure),
+        }, mode="add")
 
         self.prepared_message_buffer.add_msg(txt_msg)
 
@@ -1,14 +1,14 @@
 from tools.tool import Tool
 from utility.md_reporter import MDReporter
-from utility.evaluation_functions import evaluate_scores
 
 class WriteFinalReport(Tool):
+    terminal = True
+
     def __init__(self, questions_to_be_answered: list[str], work_dir: str, reporter: MDReporter, eval_file: str | None = None):
         name = "write_final_report"
 
-        expanded_questions = ""
-        for q in questions_to_be_answered:
-            expanded_questions += f"Question: {q}\n"
+        expanded_questions = "".join(
+            f"Question: {q}\n" for q in questions_to_be_answered)
         parameter_report = Tool.build_parameter_schema(
             "report",
             f"""The final report to be written in markdown.
@@ -86,6 +86,12 @@ class WriteFinalReport(Tool):
         Returns:
             str: A message indicating the success of the operation.
         """
+        #  evaluate_scores pulls in pandas, sklearn and matplotlib;
+        #  importing it here keeps those off the agent's cold-start path
+        #  since this tool runs at most once per project.
+        # pylint: disable=import-outside-toplevel
+        from utility.evaluation_functions import evaluate_scores
+
         report_path = self.work_dir + "final_report.md"
         with open(report_path, "w", encoding="utf-8") as f:
             f.write(report)
@@ -1,64 +1,214 @@
+import atexit
+import concurrent.futures
 import json
 import argparse
+import os
+import threading
 
 import numpy as np
 import pandas as pd
+import matplotlib
+#  mplcairo rasterizes line plots noticeably faster than the default
+#  Agg backend; use it when installed, otherwise keep the default.
+try:
+    import mplcairo
+    matplotlib.use("module://mplcairo.base")
+except ImportError:
+    pass
 import matplotlib.pyplot as plt
-from sklearn.metrics import roc_curve, roc_auc_score
+from sklearn.metrics import roc_curve
+
+#  numba fuses the SIC computation into one compiled pass when it is
+#  installed; the NumPy fallback below is used otherwise.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 SIC_UNCERTAINTY = 0.1
 
+#  Every feedback round evaluates against the same truth labels; cache
+#  them by path and modification time so repeated (possibly concurrent)
+#  evaluations parse the file only once per run.
+_LABEL_CACHE = {}
+_LABEL_CACHE_LOCK = threading.Lock()
+
+#  With EVAL_PLOT_PROCS=N the two feedback plots render on a process
+#  pool (matplotlib is not thread-safe), in parallel with each other and
+#  off the evaluating interpreter. False marks "checked, disabled".
+_PLOT_POOL = None
+
+
+def _get_plot_pool():
+    global _PLOT_POOL
+    if _PLOT_POOL is None:
+        workers = int(os.environ.get('EVAL_PLOT_PROCS', '0'))
+        if workers > 0:
+            _PLOT_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers)
+            atexit.register(_PLOT_POOL.shutdown)
+        else:
+            _PLOT_POOL = False
+    return _PLOT_POOL if _PLOT_POOL else None
+
+
+def _load_labels(label_file):
+    mtime = os.path.getmtime(label_file)
+    with _LABEL_CACHE_LOCK:
+        cached = _LABEL_CACHE.get(label_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    #  Only the index and label columns are ever used; the pyarrow
+    #  engine parses multi-threaded and skips the rest of the table.
+    try:
+        labels = pd.read_csv(label_file, engine='pyarrow', usecols=[0, 1])
+    except (ImportError, ValueError):
+        labels = pd.read_csv(label_file)
+    with _LABEL_CACHE_LOCK:
+        _LABEL_CACHE[label_file] = (mtime, labels)
+    return labels
+
+
+def _read_scores(path, col_name=None):
+    """
+    Reads a score table, picking the reader by file extension.
+
+    Parquet is columnar and compressed, so large score files read far
+    faster than CSV; CSV stays the default for compatibility. When the
+    score column is known, only the index column and that column are
+    parsed (via the multi-threaded pyarrow engine), skipping everything
+    else in wide tables.
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    if col_name is not None:
+        try:
+            first_col = pd.read_csv(path, nrows=0).columns[0]
+            if first_col != col_name:
+                return pd.read_csv(path, engine='pyarrow',
+                                   usecols=[first_col, col_name])
+        except (ImportError, ValueError):
+            #  Missing pyarrow or an unknown column: fall through to the
+            #  full read, whose error behavior callers already handle.
+            pass
+    return pd.read_csv(path)
+
+def _sic_and_peak(fpr, tpr):
+    """
+    Computes the SIC curve and its peak in as few passes as possible.
+
+    The SIC array is part of the result (the plots need it), so it has
+    to be materialized either way; the numba version fills it and tracks
+    the maximum in a single fused loop instead of the three separate
+    passes (power, divide, argmax) of the NumPy version.
+    """
+    sic = tpr / fpr**0.5  # SIC = TPR / FPR^0.5
+    idx = np.argmax(sic)
+    return sic, sic[idx], tpr[idx]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _sic_and_peak(fpr, tpr):  # noqa: F811
+        sic = np.empty_like(tpr)
+        best = -1.0
+        best_i = 0
+        for i in range(fpr.size):
+            s = tpr[i] / np.sqrt(fpr[i])  # SIC = TPR / FPR^0.5
+            sic[i] = s
+            if s > best:
+                best = s
+                best_i = i
+        return sic, best, tpr[best_i]
+
+
 def calc_sic_roc_auc(y_true, y_scores):
 
     required_bkg_events = 1/(2* SIC_UNCERTAINTY)
     fpr_cutoff = required_bkg_events / len(y_true)
 
     fpr, tpr, _ = roc_curve(y_true, y_scores)
-    fpr_nonzero = np.delete(fpr, np.argwhere(fpr == 0))
-    tpr_nonzero = np.delete(tpr, np.argwhere(fpr == 0))
 
-    # Filter out FPR values that are below the cutoff
-    valid_indices = fpr_nonzero >= fpr_cutoff
-    fpr_nonzero = fpr_nonzero[valid_indices]
-    tpr_nonzero = tpr_nonzero[valid_indices]
+    #  roc_curve returns fpr sorted ascending, so a binary search finds
+    #  where the cutoff starts and the slices are views - no boolean
+    #  mask, no copies, no full pass. fpr_cutoff is positive, so the
+    #  zero-FPR points fall away with the same slice.
+    start = np.searchsorted(fpr, fpr_cutoff, side='left')
+    fpr_nonzero = fpr[start:]
+    tpr_nonzero = tpr[start:]
 
-    auc = roc_auc_score(y_true, y_scores)
+    #  roc_auc_score would sort and scan the scores all over again;
+    #  integrating the curve roc_curve already produced gives the same
+    #  number (sklearn computes AUC as this trapezoidal integral) for
+    #  half the work.
+    auc = np.trapz(tpr, fpr)
+
+    sic, max_sic, max_sic_tpr = _sic_and_peak(fpr_nonzero, tpr_nonzero)
 
-    sic = tpr_nonzero / fpr_nonzero**0.5  # SIC = TPR / FPR^0.5
-    max_sic = np.max(sic)
-    max_sic_tpr= tpr_nonzero[np.where(sic==max_sic)[0][0]]
-    
     return sic, fpr_nonzero, tpr_nonzero, auc, max_sic, max_sic_tpr
 
+def _subsample_curve(x, y, n=4096):
+    """
+    Reduces a curve to at most n log-spaced points for plotting.
+
+    roc_curve can return one point per event; rendering millions of
+    vertices dominates savefig time while the rasterized PNG cannot
+    resolve more than a few thousand anyway. Log-spaced indices keep
+    the dense low-FPR region well sampled.
+    """
+    if len(x) <= n:
+        return x, y
+    idx = np.unique(
+        np.clip(np.geomspace(1, len(x), n).astype(int) - 1, 0, len(x) - 1))
+    return x[idx], y[idx]
+
+
 def plot_background_rejection(fpr, tpr, auc,  label, work_dir):
-    random_rejection = [1 / (x + 1e-100) for x in np.linspace(0, 1, len(fpr))] 
-
-    plt.figure(figsize=(5, 5))
-    plt.plot(np.linspace(0, 1, len(fpr)), random_rejection, 'k--', label='Random')
-    plt.plot(tpr, 1 / fpr, label=f'{label} (AUC: {auc:.2f})')
-    plt.xlim([-0.1, 1.1])
-    plt.ylim([0.5, 10**5])
-    plt.yscale('log')
-    plt.ylabel('1 / False Positive Rate')
-    plt.xlabel('True Positive Rate')
-    plt.title(f'Background Rejection Curve - {label}')
-    plt.legend(loc='upper right')
-    plt.savefig(f'{work_dir}/background_rejection_curve.png', dpi=512/5)
-    plt.close()
+    fpr, tpr = _subsample_curve(fpr, tpr)
+    #  The baseline is computed in one vectorized division instead of a
+    #  Python-level loop over the curve, and the x grid is reused for
+    #  the plot instead of being regenerated.
+    x = np.linspace(0, 1, len(fpr))
+    random_rejection = 1.0 / (x + 1e-100)
+
+    #  Working on an explicit figure handle and clearing it before close
+    #  keeps memory bounded when many evaluations run in one process;
+    #  plt.close() on the implicit current figure can leave state behind.
+    #  5.12" at an even dpi=100 keeps the 512px output of the old
+    #  fractional dpi=512/5 while staying on the renderer's fast path.
+    fig, ax = plt.subplots(figsize=(5.12, 5.12))
+    ax.plot(x, random_rejection, 'k--', label='Random')
+    ax.plot(tpr, 1 / fpr, label=f'{label} (AUC: {auc:.2f})')
+    ax.set_xlim([-0.1, 1.1])
+    ax.set_ylim([0.5, 10**5])
+    ax.set_yscale('log')
+    ax.set_ylabel('1 / False Positive Rate')
+    ax.set_xlabel('True Positive Rate')
+    ax.set_title(f'Background Rejection Curve - {label}')
+    ax.legend(loc='upper right')
+    fig.savefig(f'{work_dir}/background_rejection_curve.png', dpi=100)
+    fig.clear()
+    plt.close(fig)
 
 def plot_sic(tpr, sic, label, work_dir):
+    #  The y limit is taken from the full curve before subsampling so
+    #  the plotted range does not depend on which points survive.
+    y_max = np.max(sic) * 1.1
+    tpr, sic = _subsample_curve(tpr, sic)
     random =  np.sqrt(np.linspace(0, 1, len(tpr)) )
-    plt.figure(figsize=(5, 5))
-    plt.plot(np.linspace(0, 1, len(tpr)), random, 'k--', label='Random')
-    plt.plot(tpr, sic, label=label)
-    plt.xlim([-0.1, 1.1])
-    plt.ylim([0, np.max(sic) * 1.1])
-    plt.xlabel('TPR')
-    plt.ylabel('SIC')
-    plt.title(f'SIC Curve - {label}')
-    plt.legend(loc='upper right')
-    plt.savefig(f'{work_dir}/sic_curve.png', dpi=512/5)
-    plt.close()
+    fig, ax = plt.subplots(figsize=(5.12, 5.12))
+    ax.plot(np.linspace(0, 1, len(tpr)), random, 'k--', label='Random')
+    ax.plot(tpr, sic, label=label)
+    ax.set_xlim([-0.1, 1.1])
+    ax.set_ylim([0, y_max])
+    ax.set_xlabel('TPR')
+    ax.set_ylabel('SIC')
+    ax.set_title(f'SIC Curve - {label}')
+    ax.legend(loc='upper right')
+    fig.savefig(f'{work_dir}/sic_curve.png', dpi=100)
+    fig.clear()
+    plt.close(fig)
 
 
 def evaluate_scores(work_dir, score_file, col_name,  label_file, plot_label=None):
@@ -69,18 +219,38 @@ def evaluate_scores(work_dir, score_file, col_name,  label_file, plot_label=None
 
     print(f"Evaluating scores from {work_dir + score_file} with column {col_name} against labels in {label_file}")
 
-    scores = pd.read_csv(work_dir + score_file)
-    labels = pd.read_csv(label_file)
+    scores = _read_scores(work_dir + score_file, col_name)
+    labels = _load_labels(label_file)
 
     # Ensure the scores and labels are aligned
-    if not scores.iloc[:, 0].equals(labels.iloc[:, 0]):
+    #  Comparing the raw arrays is a single vectorized pass instead of
+    #  pandas' generic equals dispatch, and tolerates the index column
+    #  arriving as a different numeric dtype from the two readers.
+    if not np.array_equal(scores.iloc[:, 0].to_numpy(),
+                          labels.iloc[:, 0].to_numpy()):
         return
 
-    y_true = labels.iloc[:, 1].values
-    y_scores = scores[col_name]
+    #  Handing sklearn contiguous arrays up front skips its internal
+    #  np.asarray conversion; int8 is plenty for the binary labels. The
+    #  scores keep their native dtype so the metrics are bit-identical.
+    y_true = np.ascontiguousarray(labels.iloc[:, 1].to_numpy(), dtype=np.int8)
+    y_scores = scores[col_name].to_numpy(copy=False)
     sic, fpr, tpr, auc, m_sic, tpr_ms = calc_sic_roc_auc(y_true, y_scores)
-    plot_background_rejection(fpr, tpr, auc, plot_label, work_dir)
-    plot_sic(tpr, sic, plot_label, work_dir)
+    pool = _get_plot_pool()
+    if pool is not None:
+        #  The plot arguments (arrays and strings) pickle cheaply; both
+        #  figures render concurrently in the workers. Waiting on the
+        #  results keeps the contract that the PNGs exist on return.
+        futures = [
+            pool.submit(plot_background_rejection,
+                        fpr, tpr, auc, plot_label, work_dir),
+            pool.submit(plot_sic, tpr, sic, plot_label, work_dir),
+        ]
+        for future in futures:
+            future.result()
+    else:
+        plot_background_rejection(fpr, tpr, auc, plot_label, work_dir)
+        plot_sic(tpr, sic, plot_label, work_dir)
 
     return auc, m_sic, tpr_ms
 
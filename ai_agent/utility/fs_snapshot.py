@@ -0,0 +1,68 @@
+"""
+Fast filesystem snapshots for detecting files produced by executed code.
+
+The execution tools need to tell the model which files a script created.
+Globbing the whole work directory twice and diffing the path lists is
+quadratic in the number of files and stats every path a second time;
+one os.scandir pass per directory reuses the stat information the
+directory listing already carries and a dict diff is linear.
+"""
+import collections
+import os
+
+#  Bookkeeping directories whose churn should never be reported as
+#  analysis output.
+_SKIP_DIRS = {'.git', '__pycache__', '.llm_cache', '.feedback_cache'}
+
+
+def snapshot(root: str) -> dict[str, float]:
+    """
+    Records the modification time of every file below root.
+
+    Args:
+        root: Directory to snapshot.
+
+    Returns:
+        Dict mapping paths relative to root to their mtime.
+    """
+    entries = {}
+    pending = collections.deque([''])
+
+    while pending:
+        rel = pending.popleft()
+        try:
+            scan = os.scandir(os.path.join(root, rel))
+        except OSError:
+            continue
+        with scan:
+            for entry in scan:
+                rel_path = os.path.join(rel, entry.name) if rel \
+                    else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            pending.append(rel_path)
+                    else:
+                        entries[rel_path] = \
+                            entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    continue
+
+    return entries
+
+
+def changed_files(pre: dict[str, float], post: dict[str, float]) -> list[str]:
+    """
+    Lists the files that are new or were modified between two snapshots.
+
+    Args:
+        pre: Snapshot taken before the execution.
+        post: Snapshot taken after the execution.
+
+    Returns:
+        Sorted list of paths relative to the snapshot root.
+    """
+    return sorted(
+        path for path, mtime in post.items()
+        if path not in pre or mtime > pre[path]
+    )
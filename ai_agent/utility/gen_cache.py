@@ -0,0 +1,114 @@
+"""
+Structural response cache for reviewer agents.
+
+Successive reviews inside one Coder <-> Reviewer feedback loop are
+structurally near-identical prompts that differ only by small code deltas.
+Exact string caching misses on those deltas, so the cache keys on a
+structural fingerprint of the code (the AST node sequence) combined with
+hashes of the static prompt parts.
+"""
+import ast
+import hashlib
+
+
+def _sha256(text: str) -> str:
+    """
+    Hashes a string with SHA256.
+
+    Args:
+        text: The string to hash.
+
+    Returns:
+        The hex digest of the hash.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def code_fingerprint(code: str) -> str:
+    """
+    Computes a structural fingerprint of python code.
+
+    The fingerprint is the SHA256 of the dumped AST without field
+    annotations, so formatting and comment changes map to the same key
+    while structural changes do not. Code that does not parse falls back
+    to a plain content hash.
+
+    Args:
+        code: The python source code to fingerprint.
+
+    Returns:
+        The hex digest identifying the code structure.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return _sha256(code)
+    return _sha256(ast.dump(tree, annotate_fields=False))
+
+
+class GenCache:
+    """
+    In-memory cache for responses to structurally similar prompts.
+
+    Attributes:
+        hits: Number of cache hits since creation.
+        misses: Number of cache misses since creation.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+            agent_name: str,
+            system_prompt: str,
+            task: str,
+            code: str
+            ) -> tuple:
+        """
+        Builds a cache key from the static prompt parts and the code.
+
+        Args:
+            agent_name: Name of the agent the response belongs to.
+            system_prompt: The agents system prompt.
+            task: The task description the code is reviewed against.
+            code: The python code under review.
+
+        Returns:
+            A hashable key identifying the prompt structure.
+        """
+        return (
+            agent_name,
+            _sha256(system_prompt),
+            _sha256(task),
+            code_fingerprint(code)
+        )
+
+    def get(self, key: tuple):
+        """
+        Looks up a cached response.
+
+        Args:
+            key: Cache key built with make_key.
+
+        Returns:
+            The cached value or None on a miss.
+        """
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: tuple, value):
+        """
+        Stores a response under the given key.
+
+        Args:
+            key: Cache key built with make_key.
+            value: The response to cache.
+        """
+        self._cache[key] = value
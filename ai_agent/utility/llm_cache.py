@@ -0,0 +1,161 @@
+"""
+Persistent response cache for whole agent calls.
+
+Repeated runs over the same project frequently issue identical first
+turns (same system prompt, same tool schemas, same task text) and pay
+the full prefill and decode token bill every time. The cache stores the
+final output text of calls that involved no tool execution, keyed on a
+hash of everything the model sees, and replays them with zero LLM
+tokens. Entries live as small JSON files under the projects work
+directory so they survive across runs.
+
+Keys are computed twice: once over the exact message content and once
+over a whitespace-normalized form, so prompts that differ only in
+formatting still hit.
+"""
+import hashlib
+import json
+import os
+
+
+def _hash_parts(*parts: str) -> str:
+    """
+    Hashes a sequence of strings into one cache key.
+
+    Args:
+        parts: The strings making up the key.
+
+    Returns:
+        The hex digest identifying the combination.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _normalize(text: str) -> str:
+    """
+    Collapses all whitespace runs in a string to single spaces.
+
+    Args:
+        text: The string to normalize.
+
+    Returns:
+        The normalized string.
+    """
+    return " ".join(text.split())
+
+
+def _messages_text(messages: list) -> str:
+    """
+    Serializes a message list into a stable string.
+
+    Args:
+        messages: Messages in the {"role": ..., "content": ...} format.
+
+    Returns:
+        A canonical JSON rendering of the messages.
+    """
+    return json.dumps(messages, sort_keys=True, default=str)
+
+
+class LLMCache:
+    """
+    Disk-backed cache mapping full call inputs to final output text.
+
+    Attributes:
+        hits: Number of cache hits since creation.
+        misses: Number of cache misses since creation.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Creates a cache storing its entries in the given directory.
+
+        Args:
+            cache_dir: Directory for the entry files, created if missing.
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_keys(
+            model: str,
+            system_prompt: str,
+            tools_schema: list,
+            messages: list
+            ) -> tuple[str, str]:
+        """
+        Builds the exact and the normalized cache key for a call.
+
+        Args:
+            model: Name of the model the call goes to.
+            system_prompt: The agents system prompt.
+            tools_schema: The tool schemas sent with the call.
+            messages: The input messages of the call.
+
+        Returns:
+            Tuple of exact key and whitespace-normalized key.
+        """
+        schema_text = json.dumps(tools_schema, sort_keys=True, default=str)
+        message_text = _messages_text(messages)
+        exact = _hash_parts(model, system_prompt, schema_text, message_text)
+        normalized = _hash_parts(
+            model,
+            _normalize(system_prompt),
+            schema_text,
+            _normalize(message_text)
+        )
+        return exact, normalized
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + ".json")
+
+    def get(self, keys: tuple[str, str]) -> str | None:
+        """
+        Looks up the cached output text for a call.
+
+        Args:
+            keys: Key pair built with make_keys.
+
+        Returns:
+            The cached output text or None on a miss.
+        """
+        for key in keys:
+            path = self._path(key)
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        entry = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                self.hits += 1
+                return entry["output_text"]
+        self.misses += 1
+        return None
+
+    def put(self, keys: tuple[str, str], output_text: str):
+        """
+        Stores the output text of a call under both its keys.
+
+        The write is atomic (write to a temp file, then rename) so a
+        crashed run never leaves a truncated entry behind.
+
+        Args:
+            keys: Key pair built with make_keys.
+            output_text: The final output text of the call.
+        """
+        entry = json.dumps({"output_text": output_text})
+        for key in keys:
+            path = self._path(key)
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(entry)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"LLM cache write failed: {e}")
@@ -1,4 +1,52 @@
+import atexit
 import json
+import os
+import queue
+import threading
+import time
+import weakref
+
+#  All reporters share one background writer thread. Reporters come and
+#  go over a run (one per logic review, one per coder), so a thread and
+#  atexit hook per instance would accumulate; queue items carry their
+#  reporter, and only the writer thread ever touches a reporter's file
+#  handles.
+_write_queue = None
+_writer_lock = threading.Lock()
+_reporters = weakref.WeakSet()
+
+
+def _writer_loop():
+    while True:
+        reporter, kind, payload = _write_queue.get()
+        try:
+            reporter._handle_write(kind, payload)
+        except Exception as e:  # pylint: disable=broad-except
+            #  The writer thread is shared by every reporter; if it died,
+            #  all later flush()/close() calls (including the atexit
+            #  hook) would block forever on queue.join(). One bad payload
+            #  must not stop the writer.
+            print(f"Reporter write failed: {e}")
+        finally:
+            _write_queue.task_done()
+
+
+def _flush_all():
+    #  atexit hook: one final metrics snapshot per still-open reporter,
+    #  then wait for the queue to drain.
+    for reporter in list(_reporters):
+        reporter.flush()
+
+
+def _get_write_queue():
+    global _write_queue
+    with _writer_lock:
+        if _write_queue is None:
+            _write_queue = queue.Queue()
+            threading.Thread(target=_writer_loop, daemon=True).start()
+            atexit.register(_flush_all)
+    return _write_queue
+
 
 class MDReporter:
     def __init__(self, out_dir, filename="conversation"):
@@ -6,50 +54,140 @@ class MDReporter:
         self.filename = filename + ".md"
         self.metrics = {}
         self.metric_file = "metrics_" + filename + ".json"
+        #  Deliberately not metrics_*: the collector globs metric
+        #  snapshots by that prefix and would choke on a JSONL event log.
+        self.event_file = "events_" + filename + ".jsonl"
+        #  Joined once here; per-write string concatenation (and the
+        #  trailing-slash guessing it requires) is avoided on the hot
+        #  writer path.
+        self._md_path = os.path.join(out_dir, self.filename)
+        self._metric_path = os.path.join(out_dir, self.metric_file)
+        self._event_path = os.path.join(out_dir, self.event_file)
+
+        #  Markdown and metric writes go through the shared writer thread
+        #  so the agent loop never blocks on disk I/O; flush() drains the
+        #  queue. Metric events append one JSON line each to the event
+        #  log; the full snapshot is only rendered on flush, so per-event
+        #  cost does not grow with the size of the metrics dict.
+        self._metrics_lock = threading.Lock()
+        self._write_queue = _get_write_queue()
+        self._md_fd = None
+        self._event_fd = None
+        self._closed = False
+        _reporters.add(self)
+
+    def _handle_write(self, kind, payload):
+        #  Runs only on the shared writer thread; see _writer_loop.
+        if kind == "md":
+            #  The conversation file is append-only and written
+            #  constantly; keeping it open avoids an open/close
+            #  syscall pair per logged message.
+            if self._md_fd is None:
+                self._md_fd = open(self._md_path, "a")
+            self._md_fd.write(payload)
+            self._md_fd.flush()
+        elif kind == "event":
+            if self._event_fd is None:
+                self._event_fd = open(self._event_path, "a")
+            self._event_fd.write(payload)
+            self._event_fd.flush()
+        elif kind == "metrics":
+            with self._metrics_lock:
+                snapshot = json.dumps(self.metrics, indent=4)
+            #  Write-then-replace keeps the snapshot atomic, so a
+            #  crash mid-write never leaves readers (collector
+            #  scripts tail these files) with truncated JSON.
+            with open(self._metric_path + ".tmp", "w") as f:
+                f.write(snapshot)
+            os.replace(self._metric_path + ".tmp", self._metric_path)
+        elif kind == "close":
+            if self._md_fd is not None:
+                self._md_fd.close()
+                self._md_fd = None
+            if self._event_fd is not None:
+                self._event_fd.close()
+                self._event_fd = None
+
+    def _append_md(self, text):
+        self._write_queue.put((self, "md", text))
+
+    def _append_events(self, events):
+        lines = [
+            json.dumps(
+                {"ts": time.time(), "key": k, "mode": mode, "value": v},
+                default=str
+            )
+            for k, v, mode in events
+        ]
+        self._write_queue.put((self, "event", "\n".join(lines) + "\n"))
+
+    def flush(self):
+        self._write_queue.put((self, "metrics", None))
+        self._write_queue.join()
+
+    def close(self):
+        """
+        Writes a final metrics snapshot and closes this reporter's files.
+
+        Call when the reporter is replaced or its run is over; the shared
+        writer thread keeps serving other reporters, close only retires
+        this instance's file handles and drops it from the atexit flush.
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _reporters.discard(self)
+        self._write_queue.put((self, "metrics", None))
+        self._write_queue.put((self, "close", None))
+        self._write_queue.join()
 
     def report_messages(self, messages, assistant_id=None):
         for m in messages:
             self.report_message(m, assistant_id)
 
     def report_message(self, message, assistant_id=None):
-        with open(self.out_dir + self.filename, "a") as f:
-            assistant_id = "to " + assistant_id if assistant_id else ""
+        parts = []
+        assistant_id = "to " + assistant_id if assistant_id else ""
+        try:
+            if message["role"] == "system":
+                parts.append("# System Message " + assistant_id + "\n")
+            elif message["role"] == "user":
+                parts.append("# User Message " + assistant_id + "\n")
+            else:
+                parts.append("# Unknown Role " + assistant_id + "\n")
+        except KeyError:
             try:
-                if message["role"] == "system":
-                    f.write("# System Message " + assistant_id + "\n")
-                elif message["role"] == "user":
-                    f.write("# User Message " + assistant_id + "\n")
+                if message["type"] == "function_call_output":
+                    parts.append("# Function Call Output " + assistant_id + "\n")
+                    parts.append(message["output"] + "\n\n")
+                    self._append_md("".join(parts))
+                    return
                 else:
-                    f.write("# Unknown Role " + assistant_id + "\n")
+                    parts.append("# Unknown Type " + assistant_id + "\n")
             except KeyError:
+                parts.append("# Unknown Message" + assistant_id + "\n")
+
+        if isinstance(message["content"], list):
+            for i, m in enumerate(message["content"]):
                 try:
-                    if message["type"] == "function_call_output": 
-                        f.write("# Function Call Output " + assistant_id + "\n")
-                        f.write(message["output"] + "\n\n")
-                        return
-                    else:
-                        f.write("# Unknown Type " + assistant_id + "\n")
-                except KeyError:
-                    f.write("# Unknown Message" + assistant_id + "\n")
-
-            if isinstance(message["content"], list):
-                for i, m in enumerate(message["content"]):
-                    try:
-                        if m["type"] == "input_image":
-                            f.write(f"Image {i}\n")
-                        else:
-                            f.write(str(m) + "\n")
-                    except KeyError:
-                        f.write(str(m) + "\n")
-            else:
-                try:
-                    if message["type"] == "image_url":
-                        f.write("Some Image\n")
+                    if m["type"] == "input_image":
+                        parts.append(f"Image {i}\n")
                     else:
-                        f.write(str(message["content"]) + "\n")
+                        parts.append(str(m) + "\n")
                 except KeyError:
-                    f.write(message["content"] + "\n\n")
-    
+                    parts.append(str(m) + "\n")
+        else:
+            try:
+                if message["type"] == "image_url":
+                    parts.append("Some Image\n")
+                else:
+                    parts.append(str(message["content"]) + "\n")
+            except KeyError:
+                parts.append(message["content"] + "\n\n")
+
+        self._append_md("".join(parts))
+
     def report_assistant_response(self, response, assistant_id=None):
         assistant_id = "from " + assistant_id if assistant_id else ""
 
@@ -78,49 +216,43 @@ class MDReporter:
         else:
             self.report_metrics("no_usage_provided", 1, "add")
 
-        with open(self.out_dir + self.filename, "a") as f:
-            f.write("# Response " + assistant_id + "\n")
-            
-            for output in response.output:
-                if output.type == "message":
-                    for content in output.content:
-                        f.write("## Message\n")
-                        f.write(content.text + "\n\n")
-                elif output.type == "function_call":
-                    f.write("## Function Call\n")
-                    f.write(f"{output.name}({output.arguments})\n\n")
-                elif output.type == 'reasoning':
-                    f.write("## Reasoning\n")
-                    for summary in output.summary:
-                        f.write(f"{summary.text}\n\n")
-                else:
-                    f.write("## Unknown Output\n")
-                    f.write(f"{output.type}\n\n")
-    
+        parts = ["# Response " + assistant_id + "\n"]
+
+        for output in response.output:
+            if output.type == "message":
+                for content in output.content:
+                    parts.append("## Message\n")
+                    parts.append(content.text + "\n\n")
+            elif output.type == "function_call":
+                parts.append("## Function Call\n")
+                parts.append(f"{output.name}({output.arguments})\n\n")
+            elif output.type == 'reasoning':
+                parts.append("## Reasoning\n")
+                for summary in output.summary:
+                    parts.append(f"{summary.text}\n\n")
+            else:
+                parts.append("## Unknown Output\n")
+                parts.append(f"{output.type}\n\n")
+
+        self._append_md("".join(parts))
+
     def report_image(self, path):
-        with open(self.out_dir + self.filename, "a") as f:
-            f.write("# Image\n")
-            f.write(f"![Image]({path})\n\n")
+        self._append_md("# Image\n" + f"![Image]({path})\n\n")
 
     def report_text(self, text, file_name):
-        with open(self.out_dir + self.filename, "a") as f:
-            f.write(f"# Text File ({file_name})\n")
-            f.write(f"{text}\n\n")
+        self._append_md(f"# Text File ({file_name})\n" + f"{text}\n\n")
 
     def report_max_calls(self, agent_id=None):
-        with open(self.out_dir + self.filename, "a") as f:
-            f.write("# Max Calls Reached\n")
-            if agent_id:
-                f.write(f"Max calls reached for {agent_id}\n")
-            else:
-                f.write("Max calls reached\n")
+        if agent_id:
+            self._append_md(
+                "# Max Calls Reached\n" + f"Max calls reached for {agent_id}\n")
+        else:
+            self._append_md("# Max Calls Reached\n" + "Max calls reached\n")
 
     def report_completion_time(self, time):
-        with open(self.out_dir + self.filename, "a") as f:
-            f.write("# Completion Time\n")
-            f.write(f"Completion time: {time}\n")
+        self._append_md("# Completion Time\n" + f"Completion time: {time}\n")
 
-    def report_metrics(self, metric, value , mode="append"):
+    def _apply_metric(self, metric, value, mode):
         if mode == "append":
             if metric not in self.metrics:
                 self.metrics[metric] = []
@@ -134,10 +266,17 @@ class MDReporter:
         else:
             raise ValueError("Invalid mode. Use 'append', 'overwrite', or 'add'.")
 
-        file_path = f"{self.out_dir}{self.metric_file}"
+    def report_metrics(self, metric, value , mode="append"):
+        with self._metrics_lock:
+            self._apply_metric(metric, value, mode)
+
+        self._append_events([(metric, value, mode)])
 
-        with open(file_path, "w") as f:
-            f.write(json.dumps(self.metrics, indent=4))
-            
+    def report_metrics_batch(self, metrics, mode="append"):
+        #  One lock acquisition and one event write for several metrics.
+        with self._metrics_lock:
+            for metric, value in metrics.items():
+                self._apply_metric(metric, value, mode)
 
-    
\ No newline at end of file
+        self._append_events(
+            [(metric, value, mode) for metric, value in metrics.items()])
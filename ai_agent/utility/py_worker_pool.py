@@ -0,0 +1,213 @@
+"""
+Pool of pre-warmed python workers for executing analysis scripts.
+
+Every executed script normally pays interpreter startup plus the import
+cost of the heavy analysis libraries (numpy, pandas, matplotlib), which
+dominates the runtime of small scripts. The pool keeps persistent
+worker processes that import those libraries once and then execute
+scripts on request via runpy, Jupyter-kernel style.
+
+Workers talk a line-based JSON protocol over their pipes. Script output
+is captured inside the worker and returned in the reply, which is
+prefixed with a marker so stray output from native code cannot corrupt
+the protocol. A worker is recycled after a fixed number of jobs to
+bound state leakage between scripts.
+"""
+import json
+import queue
+import subprocess
+import sys
+import threading
+
+#  Replies are tagged so the reader can skip anything a script leaks
+#  past the in-worker capture (e.g. C-level prints).
+_MARKER = '@@pyworker@@'
+
+#  Tail returned per stream, matching the execution tools.
+_OUTPUT_LIMIT = 64 * 1024
+
+#  Jobs a worker handles before it is replaced by a fresh process.
+_RECYCLE_AFTER = 32
+
+_WORKER_SOURCE = r'''
+import contextlib, io, json, os, runpy, sys, traceback
+
+for _mod in ("numpy", "pandas", "matplotlib", "sklearn", "scipy"):
+    try:
+        __import__(_mod)
+    except ImportError:
+        pass
+
+sys.stdout.write("@@pyworker@@ready\n")
+sys.stdout.flush()
+
+for line in sys.stdin:
+    line = line.strip()
+    if not line:
+        continue
+    job = json.loads(line)
+    out_buf, err_buf = io.StringIO(), io.StringIO()
+    status = 0
+    cwd_backup = os.getcwd()
+    argv_backup = sys.argv
+    try:
+        os.chdir(job["cwd"])
+        sys.argv = [job["script"]] + job["argv"]
+        with contextlib.redirect_stdout(out_buf), \
+                contextlib.redirect_stderr(err_buf):
+            runpy.run_path(job["script"], run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            status = e.code
+        elif e.code is not None:
+            err_buf.write(str(e.code) + "\n")
+            status = 1
+    except BaseException:
+        err_buf.write(traceback.format_exc())
+        status = 1
+    finally:
+        sys.argv = argv_backup
+        os.chdir(cwd_backup)
+    reply = json.dumps({
+        "stdout": out_buf.getvalue()[-65536:],
+        "stderr": err_buf.getvalue()[-65536:],
+        "status": status
+    })
+    sys.stdout.write("@@pyworker@@" + reply + "\n")
+    sys.stdout.flush()
+'''
+
+
+class _Worker:
+    """
+    One persistent worker process of the pool.
+
+    Attributes:
+        jobs_done: Number of jobs this worker has executed.
+    """
+
+    def __init__(self):
+        self.jobs_done = 0
+        self._proc = subprocess.Popen(
+            [sys.executable, '-u', '-c', _WORKER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
+    def _read_reply(self, result: list):
+        for line in self._proc.stdout:
+            if line.startswith(_MARKER):
+                payload = line[len(_MARKER):].strip()
+                if payload != 'ready':
+                    result.append(payload)
+                    return
+        result.append(None)
+
+    def run(self, script: str, argv: list[str], cwd: str,
+            timeout: float) -> tuple[str, str, int] | None:
+        """
+        Executes one script on this worker.
+
+        Args:
+            script: Path of the script, relative to cwd or absolute.
+            argv: Command line arguments for the script.
+            cwd: Working directory for the execution.
+            timeout: Seconds before the worker is considered stuck.
+
+        Returns:
+            Tuple of stdout, stderr and exit status, or None if the
+            worker died or timed out (the caller must discard it).
+        """
+        job = json.dumps({'script': script, 'argv': argv, 'cwd': cwd})
+        try:
+            self._proc.stdin.write(job + '\n')
+            self._proc.stdin.flush()
+        except OSError:
+            return None
+
+        result = []
+        reader = threading.Thread(
+            target=self._read_reply, args=(result,), daemon=True)
+        reader.start()
+        reader.join(timeout)
+        if reader.is_alive() or not result or result[0] is None:
+            return None
+
+        self.jobs_done += 1
+        try:
+            reply = json.loads(result[0])
+        except json.JSONDecodeError:
+            return None
+        return reply['stdout'], reply['stderr'], reply['status']
+
+    def close(self):
+        """
+        Terminates the worker process.
+        """
+        self._proc.kill()
+        self._proc.wait()
+
+
+class PyWorkerPool:
+    """
+    Fixed-size pool of pre-warmed python workers.
+
+    Callers borrow a worker per job; borrowing blocks while all workers
+    are busy, which also caps the number of concurrently executing
+    scripts.
+    """
+
+    def __init__(self, size: int):
+        """
+        Creates the pool and starts its workers.
+
+        Args:
+            size: Number of persistent worker processes.
+        """
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(_Worker())
+
+    def run(self, script: str, argv: list[str], cwd: str,
+            timeout: float) -> tuple[str, str, int]:
+        """
+        Executes a script on the next free worker.
+
+        A worker that died, timed out or reached its recycle limit is
+        replaced by a fresh process afterwards.
+
+        Args:
+            script: Path of the script, relative to cwd or absolute.
+            argv: Command line arguments for the script.
+            cwd: Working directory for the execution.
+            timeout: Seconds before the execution is aborted.
+
+        Returns:
+            Tuple of stdout, stderr and exit status.
+        """
+        worker = self._idle.get()
+        try:
+            result = worker.run(script, argv, cwd, timeout)
+            if result is None:
+                worker.close()
+                worker = _Worker()
+                return ('', f'Execution failed or exceeded {timeout}s '
+                        'timeout; worker was restarted', -1)
+            if worker.jobs_done >= _RECYCLE_AFTER:
+                worker.close()
+                worker = _Worker()
+            return result
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        """
+        Terminates all idle workers.
+        """
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -16,12 +16,16 @@ class Task:
         self.task_status = -1
         self.comment = []
         self.report = None
+        #  Rendered info text, rebuilt lazily after state changes; agents
+        #  often re-request the same task info between mutations.
+        self._info_cache = None
 
     def activate_task(self):
         """
         Activates the task by setting its status to 0.
         """
         self.task_status = 0
+        self._info_cache = None
 
     def deactivate_task(self, comment):
         """
@@ -31,6 +35,7 @@ class Task:
         """
         self.task_status = -1
         self.comment.append(comment)
+        self._info_cache = None
 
     def complete_task(self, report):
         """
@@ -40,6 +45,7 @@ class Task:
         """
         self.task_status = 1
         self.report = report
+        self._info_cache = None
 
     def get_task_status(self)->str:
         """
@@ -62,13 +68,15 @@ class Task:
         Returns:
             str: A formatted string containing the task's information.
         """
-        return f"""Task ID: {self.task_id},
+        if self._info_cache is None:
+            self._info_cache = f"""Task ID: {self.task_id},
                 Task Name: {self.task_name},
                 Task Description: {self.task_description},
                 Task Status: {self.get_task_status()},
                 Comments: {self.comment},
                 Report: {self.report}
                 """
+        return self._info_cache
     
     def get_task_overview(self)-> str:
         """
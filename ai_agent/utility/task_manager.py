@@ -1,52 +1,157 @@
+import json
+import os
+
 from utility.task import Task
 
 class TaskManager:
-    def __init__(self):
+    def __init__(self, work_dir: str = None):
+        """
+        Creates a task manager, optionally with a write-ahead log.
+
+        With a work_dir every task mutation is appended to a tasks.wal
+        file immediately, so task state survives crashes instead of only
+        being written at the end of the run. An existing log is replayed
+        on startup.
+
+        Args:
+            work_dir: Directory for the write-ahead log, logging is
+                disabled if none is provided.
+        """
         self.tasks = []
+        #  Tasks are addressed by id on every tool call; the index keeps
+        #  those lookups O(1) instead of scanning the list.
+        self._task_by_id = {}
+        #  Rendered open-task listing, rebuilt lazily after mutations;
+        #  agents request the task list far more often than they change it.
+        self._tasks_rendered = None
         self.active_task = -1
+        self._work_dir = work_dir
+        self._wal_path = work_dir + "tasks.wal" if work_dir else None
+        self._wal_fd = None
+        self._replaying = False
+        if self._wal_path and os.path.exists(self._wal_path):
+            self._replay_wal()
+
+    def _log(self, record: dict):
+        if self._wal_path is None or self._replaying:
+            return
+        try:
+            if self._wal_fd is None:
+                self._wal_fd = open(self._wal_path, "a", encoding="utf-8")
+            self._wal_fd.write(json.dumps(record) + "\n")
+            #  flush per record is enough for crash safety here; fsync is
+            #  deferred to save_tasks at the end of the run.
+            self._wal_fd.flush()
+        except OSError as e:
+            print(f"Task log write failed: {e}")
+
+    def _replay_wal(self):
+        self._replaying = True
+        try:
+            with open(self._wal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    op = record.get("op")
+                    if op == "add":
+                        self.add_task(Task(
+                            record["id"],
+                            record["name"],
+                            record["description"],
+                            self._work_dir
+                        ))
+                    elif op == "activate":
+                        self.activate_task(record["id"])
+                    elif op == "deactivate":
+                        self.deactivate_task(record["id"], record["comment"])
+                    elif op == "complete":
+                        self.complete_task(record["id"], record["report"])
+        finally:
+            self._replaying = False
 
     def add_task(self, task: Task):
         self.tasks.append(task)
+        self._task_by_id[task.task_id] = task
+        self._tasks_rendered = None
+        self._log({
+            "op": "add",
+            "id": task.task_id,
+            "name": task.task_name,
+            "description": task.task_description
+        })
 
     def show_tasks(self):
-        tasks_overview = ""
-        for task in self.tasks:
-            if task.task_status != 1:
-                tasks_overview += task.get_task_overview() + "\n"
-        return tasks_overview
-    
+        if self._tasks_rendered is None:
+            self._tasks_rendered = "".join(
+                task.get_task_overview() + "\n"
+                for task in self.tasks
+                if task.task_status != 1
+            )
+        return self._tasks_rendered
+
+    def get_task(self, task_id: int):
+        """
+        Returns the task with the given id, or None if it does not exist.
+        """
+        return self._task_by_id.get(task_id)
+
     def show_task_info(self, task_id: int):
-        for task in self.tasks:
-            if task.task_id == task_id:
-                return task.get_task_info()
-        return "Task not found."
-    
+        task = self._task_by_id.get(task_id)
+        if task is None:
+            return "Task not found."
+        return task.get_task_info()
+
     def activate_task(self, task_id: int):
-        for task in self.tasks:
-            if task.task_id == task_id:
-                if self.active_task != -1:
-                    self.deactivate_task(self.active_task, "Deactivated due to new activation.")
-                task.activate_task()
-                self.active_task = task_id
-                return f"Task {task_id} activated."
-        return "Task not found."
-    
+        task = self._task_by_id.get(task_id)
+        if task is None:
+            return "Task not found."
+        if self.active_task != -1:
+            self.deactivate_task(self.active_task, "Deactivated due to new activation.")
+        task.activate_task()
+        self.active_task = task_id
+        self._tasks_rendered = None
+        self._log({"op": "activate", "id": task_id})
+        return f"Task {task_id} activated."
+
     def deactivate_task(self, task_id: int, comment: str):
-        for task in self.tasks:
-            if task.task_id == task_id:
-                task.deactivate_task(comment)
-                self.active_task = -1
-                return f"Task {task_id} deactivated."
-        return "Task not found."
-    
+        task = self._task_by_id.get(task_id)
+        if task is None:
+            return "Task not found."
+        task.deactivate_task(comment)
+        self.active_task = -1
+        self._tasks_rendered = None
+        self._log({
+            "op": "deactivate", "id": task_id, "comment": comment})
+        return f"Task {task_id} deactivated."
+
     def complete_task(self, task_id: int, report: str):
-        for task in self.tasks:
-            if task.task_id == task_id:
-                task.complete_task(report)
-                self.active_task = -1
-                return f"Task {task_id} completed."
-        return "Task not found."
-    
+        task = self._task_by_id.get(task_id)
+        if task is None:
+            return "Task not found."
+        task.complete_task(report)
+        self.active_task = -1
+        self._tasks_rendered = None
+        self._log({"op": "complete", "id": task_id, "report": report})
+        return f"Task {task_id} completed."
+
     def save_tasks(self):
         for task in self.tasks:
-            task.save_task()
\ No newline at end of file
+            task.save_task()
+
+        #  The per-task markdown files are the compacted snapshot; once
+        #  they are durable the log has served its purpose and is
+        #  truncated for the next run.
+        if self._wal_path is None:
+            return
+        try:
+            if self._wal_fd is not None:
+                self._wal_fd.flush()
+                os.fsync(self._wal_fd.fileno())
+                self._wal_fd.close()
+                self._wal_fd = None
+            with open(self._wal_path, "w", encoding="utf-8"):
+                pass
+        except OSError as e:
+            print(f"Task log truncate failed: {e}")
@@ -13,27 +13,28 @@ def make_output_dir(basis_path, job_number: int = None):
     if job_number is not None:
         start = f'job_{job_number}_'
     # Create a unique subdirectory for this run
-    # get the output folders
-    folders = os.listdir(basis_path)
-    # get the highest number
+    # get the highest run number among the existing output folders
+    #  os.scandir streams the entries instead of materializing the whole
+    #  listing, which matters for sweep directories with thousands of
+    #  prior runs; rsplit avoids splitting the entire name.
     highest_number = 0
-    for folder in folders:
-        if folder.startswith(start):
+    with os.scandir(basis_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith(start):
+                continue
             try:
-                number = int(folder.split("_")[-1])
-                if number > highest_number:
-                    highest_number = number
-            except ValueError:
-                pass
+                number = int(entry.name.rsplit("_", 1)[1])
+            except (IndexError, ValueError):
+                continue
+            if number > highest_number:
+                highest_number = number
     # create the new folder
     i = highest_number + 1
 
-    if basis_path[-1] != "/":
-        basis_path += "/"
+    #  os.path.join handles the separator; callers concatenate onto the
+    #  returned path, so the trailing one is kept.
+    run_dir = os.path.join(basis_path, f"{start}{i}") + "/"
+    os.makedirs(run_dir, exist_ok=True)
 
-    run_dir = basis_path + start + str(i) + "/"
-    if not os.path.exists(run_dir):
-        os.makedirs(run_dir)
-    
     return run_dir
 
@@ -7,6 +7,7 @@ The CSV files can be generated  with the metric_collector script/
 """
 import argparse
 import json
+import os
 
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -34,17 +35,19 @@ def compare_batches(
             Optional list of labels for each batch. If not provided, defaults to
             'Batch 0', 'Batch 1', etc.
     """
-    if out_dir[-1] != '/':
-        out_dir += '/'
-
     metrics = set()
     for batch in batches:
         metrics.update(batch.keys())
 
     for metric in metrics:
-        plt.figure(figsize=(10, 6))
+        #  An explicit handle lets the figure be cleared and closed
+        #  deterministically at the end of the loop iteration, keeping
+        #  memory flat over many metrics.
+        fig, ax = plt.subplots(figsize=(10, 6))
         # Concatenate all values for this metric to compute common bin edges
-        all_values = []
+        #  Staying in NumPy avoids boxing every value into a Python float
+        #  via tolist() and rescanning the boxed list for min/max/ptp.
+        arrays = []
         for batch in batches:
             if metric not in batch:
                 print(
@@ -54,7 +57,8 @@ def compare_batches(
                     """
                     )
                 continue
-            all_values.extend(batch[metric].dropna().tolist())
+            arrays.append(batch[metric].dropna().to_numpy())
+        all_values = np.concatenate(arrays) if arrays else np.empty(0)
 
         range_ = np.ptp(all_values)  # Range of all values
         if range_ == 0:
@@ -65,11 +69,11 @@ def compare_batches(
             # Set dist to next highest power of 10 <= range / 2
             dist = 10 ** int(np.floor(np.log10(range_/2)))
             epsilon = 1e-2
-            bins = np.arange(min(all_values) - dist / 2,
-                             max(all_values) + dist, dist)
-            xtics = np.arange(min(all_values),
-                              max(all_values) + dist + epsilon, dist)
-            xlim = (min(all_values) - dist , max(all_values) + dist )
+            v_min = all_values.min()
+            v_max = all_values.max()
+            bins = np.arange(v_min - dist / 2, v_max + dist, dist)
+            xtics = np.arange(v_min, v_max + dist + epsilon, dist)
+            xlim = (v_min - dist, v_max + dist)
 
         for i, batch in enumerate(batches):
             if metric not in batch:
@@ -80,17 +84,23 @@ def compare_batches(
                     )
                 continue
             label = labels[i] if labels and i < len(labels) else f'Batch {i}'
-            plt.hist(batch[metric], bins=bins, alpha=0.5, label=label)
-
-        plt.xticks(xtics)
-        plt.xlim(xlim)
-        plt.title(f'Histogram of {metric}')
-        plt.xlabel('Value')
-        plt.ylabel('Frequency')
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(f'{out_dir}histogram_{metric}.png')
-        plt.close()
+            #  Binning through np.histogram and drawing one stairs patch
+            #  skips matplotlib's hist path, which re-bins internally and
+            #  builds a Patch per bar for every batch.
+            counts, _ = np.histogram(batch[metric].dropna().to_numpy(),
+                                     bins=bins)
+            ax.stairs(counts, bins, alpha=0.5, label=label, fill=True)
+
+        ax.set_xticks(xtics)
+        ax.set_xlim(xlim)
+        ax.set_title(f'Histogram of {metric}')
+        ax.set_xlabel('Value')
+        ax.set_ylabel('Frequency')
+        ax.legend()
+        ax.grid(True)
+        fig.savefig(os.path.join(out_dir, f'histogram_{metric}.png'))
+        fig.clear()
+        plt.close(fig)
 
     print('Histograms generated for all metrics.')
 
@@ -125,7 +135,7 @@ def compare_batches_2(
     for metric in metrics:
         fig, _ = vertical_scatter.vertical_scatter(all_data, metric)
 
-        fig.savefig(f'{out_dir}vertical_scatter_{metric}.png')
+        fig.savefig(os.path.join(out_dir, f'vertical_scatter_{metric}.png'))
         plt.close(fig)
 
 def compare_batches_3(
@@ -155,12 +165,19 @@ def compare_batches_3(
 
     metrics = set()
 
+    #  The scatter library calls the sorting function per data row; a
+    #  dict lookup replaces the O(n) list.index scan, and an unknown
+    #  category is warned about once instead of once per row.
+    label_order = {label: i for i, label in enumerate(labels)}
+    warned_categories = set()
+
     def sorting_fun(category):
-        try:
-            key = labels.index(category)
-        except ValueError:
-            print(f"Warning: Category '{category}' not found in labels."
-                  f" Using default index.")
+        key = label_order.get(category)
+        if key is None:
+            if category not in warned_categories:
+                warned_categories.add(category)
+                print(f"Warning: Category '{category}' not found in labels."
+                      f" Using default index.")
             key = 0
         return key
 
@@ -190,10 +207,11 @@ def compare_batches_3(
                     general_settings=general_settings
                     )
 
-        fig.savefig(f'{out_dir}vertical_scatter_{metric}.png', dpi=600)
+        fig.savefig(os.path.join(out_dir, f'vertical_scatter_{metric}.png'),
+                    dpi=600)
         plt.close(fig)
 
-        meta.to_csv(f'{out_dir}data_{metric}.csv')
+        meta.to_csv(os.path.join(out_dir, f'data_{metric}.csv'))
 
 
 if __name__ == '__main__':
@@ -233,20 +251,27 @@ if __name__ == '__main__':
     if args.labels and len(args.batches) != len(args.labels):
         raise ValueError('Number of batches must match number of labels.')
 
+    #  pyarrow's CSV reader parses each file multi-threaded; ArrowInvalid
+    #  subclasses ValueError, so the per-file error handling still holds.
+    try:
+        import pyarrow.csv as pac
+    except ImportError:
+        pac = None
+
     for batch_file in args.batches:
         try:
             print(f'Reading batch file: {batch_file}')
-            b = pd.read_csv(batch_file)
+            if pac is not None:
+                b = pac.read_csv(batch_file).to_pandas()
+            else:
+                b = pd.read_csv(batch_file)
             bs.append(b)
-        except (FileNotFoundError, pd.errors.ParserError) as e:
+        except (FileNotFoundError, pd.errors.ParserError, ValueError) as e:
             print(f'Error reading {batch_file}: {e}')
 
     od = args.out_dir
     if not od:
-        od = './'
-
-    if od[-1] != '/':
-        od += '/'
+        od = '.'
     if args.advanced_parameters_file:
         try:
             with open(args.advanced_parameters_file, 'r') as f:
@@ -3,8 +3,45 @@ import argparse
 import pandas as pd
 import numpy as np
 
+#  numba compiles a fused bounds-check + arithmetic + default-fill
+#  kernel per operation when it is installed; the masked NumPy path
+#  stays as the fallback.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 VALID_OPERATIONS = ['+', '-', '*', '/', 'root', 'log_base', 'ln', 'exp', '**']
 
+
+def _read_csv(path):
+    #  pyarrow's CSV reader parses multi-threaded; ArrowInvalid
+    #  subclasses ValueError, so malformed files fall back to the C
+    #  parser whose errors callers already handle.
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
+#  Unary operations only consume name1; name2 is never resolved for them.
+UNARY_OPERATIONS = ('ln', 'exp')
+
+#  Operation dispatch table; only the valid entries are ever computed,
+#  so no transcendental work is wasted on rows that get the default
+#  anyway (and no divide/invalid warnings are emitted for them).
+OP_TABLE = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.divide,
+    '**': np.power,
+    'root': lambda a, b: np.power(a, 1 / b),
+    'log_base': lambda a, b: np.log(a) / np.log(b),
+    'ln': np.log,
+    'exp': np.exp,
+}
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Derive quantities from metrics.")
     parser.add_argument(
@@ -32,124 +69,252 @@ def parse_args():
 
     return parser.parse_args()
 
+def _compile_kernels():
+    """
+    Compiles one fused, parallel kernel per operation.
+
+    Each kernel does the bounds check, the arithmetic and the default
+    fill in a single pass over the operands, which LLVM vectorizes and
+    prange spreads across cores. fastmath is deliberately off: the
+    validity of NaN entries relies on IEEE comparison semantics.
+    """
+    def binary(op):
+        op = njit(op)
+
+        @njit(parallel=True)
+        def kernel(v1, lo1, hi1, v2, lo2, hi2, default, out):
+            for i in prange(out.size):
+                a = v1[i]
+                b = v2[i]
+                if lo1 <= a <= hi1 and lo2 <= b <= hi2:
+                    out[i] = op(a, b)
+                else:
+                    out[i] = default
+        return kernel
+
+    def unary(op):
+        op = njit(op)
+
+        @njit(parallel=True)
+        def kernel(v1, lo1, hi1, default, out):
+            for i in prange(out.size):
+                a = v1[i]
+                if lo1 <= a <= hi1:
+                    out[i] = op(a)
+                else:
+                    out[i] = default
+        return kernel
+
+    return {
+        '+': binary(lambda a, b: a + b),
+        '-': binary(lambda a, b: a - b),
+        '*': binary(lambda a, b: a * b),
+        '/': binary(lambda a, b: a / b),
+        '**': binary(lambda a, b: a ** b),
+        'root': binary(lambda a, b: a ** (1.0 / b)),
+        'log_base': binary(lambda a, b: np.log(a) / np.log(b)),
+        'ln': unary(lambda a: np.log(a)),
+        'exp': unary(lambda a: np.exp(a)),
+    }
+
+
+_KERNELS = _compile_kernels() if njit is not None else None
+
+
+def _as_kernel_operand(values, n):
+    """Returns a contiguous float64 array for the kernels, or None."""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind not in 'fiu':
+            return None
+        return np.ascontiguousarray(values, dtype=np.float64)
+    return np.full(n, values)
+
+
+def _normalize_quantities(quantities_df):
+    """
+    Casts the bounds columns to float64 and validates them in one pass.
+
+    Replaces the per-row parse_value calls: 'inf' in a min column keeps
+    meaning -inf as before, numeric strings become floats, and a
+    non-numeric or inverted bound raises with the offending rows listed
+    instead of failing one row at a time.
+    """
+    q = quantities_df.copy()
+    for col, inf_value in (('min1', -np.inf), ('max1', np.inf),
+                           ('min2', -np.inf), ('max2', np.inf)):
+        values = q[col].astype(str).str.strip().str.lower()
+        try:
+            q[col] = pd.to_numeric(values.replace({'inf': inf_value}))
+        except ValueError as exc:
+            raise ValueError(f"Invalid {col} value: {exc}") from exc
+
+    for min_col, max_col in (('min1', 'max1'), ('min2', 'max2')):
+        inverted = q[min_col] > q[max_col]
+        if inverted.any():
+            raise ValueError(
+                f"{min_col} must be less than or equal to {max_col} for: "
+                f"{q.loc[inverted, 'name'].tolist()}")
+
+    #  The categorical dtype stores operations as integer codes over one
+    #  interned string table and doubles as validation: anything outside
+    #  the declared operations becomes NaN.
+    q['operation'] = q['operation'].astype(
+        pd.CategoricalDtype(VALID_OPERATIONS))
+    bad_op = q['operation'].isna()
+    if bad_op.any():
+        raise ValueError(
+            f"Invalid operation for: {q.loc[bad_op, 'name'].tolist()}. "
+            f"Valid operations are: {', '.join(VALID_OPERATIONS)}")
+    return q
+
+
+def _valid_mask(operands):
+    """
+    Builds the validity mask for a list of (values, min, max) operands.
+
+    Scalar operands contribute a single comparison; array operands are
+    checked elementwise. NaN compares False, so missing values end up
+    invalid, as before.
+    """
+    scalars_ok = True
+    arrays = []
+    for values, v_min, v_max in operands:
+        if isinstance(values, np.ndarray):
+            arrays.append((values, v_min, v_max))
+        elif not v_min <= values <= v_max:
+            scalars_ok = False
+    if not arrays:
+        return scalars_ok
+    #  Each comparison after the first writes into one scratch buffer
+    #  and the AND runs in place, so building the mask touches two
+    #  boolean arrays total instead of allocating one per comparison.
+    values, v_min, v_max = arrays[0]
+    mask = np.greater_equal(values, v_min)
+    tmp = np.less_equal(values, v_max)
+    mask &= tmp
+    for values, v_min, v_max in arrays[1:]:
+        np.greater_equal(values, v_min, out=tmp)
+        mask &= tmp
+        np.less_equal(values, v_max, out=tmp)
+        mask &= tmp
+    if not scalars_ok:
+        mask[:] = False
+    return mask
+
+
 def derive_quantities(metrics_df, quantities_df):
-    out_df = pd.DataFrame()
-
-    for _, row in quantities_df.iterrows():
-        name = row['name']
-
-        # Helper to parse numeric or string values
-        def parse_value(val, is_min=False):
-            if isinstance(val, (int, float)):
-                return val
-            if isinstance(val, str):
-                val_strip = val.strip()
-                if val_strip.lower() == 'inf':
-                    return -np.inf if is_min else np.inf
-                try:
-                    return float(val_strip)
-                except ValueError:
-                    return val_strip  # Return as string if not numeric
-            return val
-
-        v1 = parse_value(row['name1'])
-        v1_min = parse_value(row['min1'], is_min=True)
-        v1_max = parse_value(row['max1'])
-        if not isinstance(v1_min, (int, float)):
-            raise ValueError(f"Invalid min1 value: {v1_min}")
-        if not isinstance(v1_max, (int, float)):
-            raise ValueError(f"Invalid max1 value: {v1_max}")
-        if not (v1_min <= v1_max):
-            raise ValueError(f"min1 ({v1_min}) must be less than or equal to max1 ({v1_max}) for {name}.")
-
-        v2 = parse_value(row['name2'])
-        v2_min = parse_value(row['min2'], is_min=True)
-        v2_max = parse_value(row['max2'])
-        if not isinstance(v2_min, (int, float)):
-            raise ValueError(f"Invalid min2 value: {v2_min}")
-        if not isinstance(v2_max, (int, float)):
-            raise ValueError(f"Invalid max2 value: {v2_max}")
-        if not (v2_min <= v2_max):
-            raise ValueError(f"min2 ({v2_min}) must be less than or equal to max2 ({v2_max}) for {name}.")
-
-        operation = row['operation']
-        default = row['default']    
-
-        if name in metrics_df.columns:
+    quantities_df = _normalize_quantities(quantities_df)
+    n = len(metrics_df)
+    #  One hashable set instead of repeated lookups on the pandas Index.
+    metrics_cols = set(metrics_df.columns)
+    #  Derived columns accumulate in a plain dict and become a DataFrame
+    #  once at the end; assigning columns to a growing frame rebuilds the
+    #  column index on every insert.
+    out_cols = {}
+
+    def resolve(ref):
+        #  Column references come back as the frame's backing arrays (no
+        #  copy, no index machinery); numeric constants stay scalars -
+        #  NumPy broadcasts them for free, so no length-n array is ever
+        #  allocated for them. Unresolvable references become NaN, which
+        #  fails every bounds check just like the old NaN Series did.
+        if isinstance(ref, str):
+            ref = ref.strip()
+            if ref in metrics_cols:
+                return metrics_df[ref].to_numpy()
+            if ref in out_cols:
+                return out_cols[ref]
+            try:
+                return float(ref)
+            except ValueError:
+                return np.nan
+        if isinstance(ref, (int, float)):
+            return float(ref)
+        return np.nan
+
+    #  itertuples hands out lightweight namedtuples; iterrows builds a
+    #  full Series per row just to read a handful of fields.
+    for row in quantities_df.itertuples(index=False):
+        name = row.name
+
+        #  Bounds arrive as plain float64 scalars from
+        #  _normalize_quantities; no per-row parsing remains.
+        v1_min = row.min1
+        v1_max = row.max1
+        v2_min = row.min2
+        v2_max = row.max2
+
+        operation = row.operation
+        default = row.default
+
+        if name in metrics_cols:
             raise ValueError(f"Column '{name}' already exists in metrics_df. Please choose a different name.")
-        
-        if operation not in VALID_OPERATIONS:
-            raise ValueError(f"Invalid operation '{operation}'. Valid operations are: {', '.join(VALID_OPERATIONS)}")
-        
-        # Prepare v1 and v2 as Series or None
-        v1_series = None
-        v2_series = None
-
-        if isinstance(v1, str) and v1 in metrics_df.columns:
-            v1_series = metrics_df[v1]
-        elif isinstance(v1, (int, float)):
-            v1_series = pd.Series(v1, index=metrics_df.index)
-        elif isinstance(v1,str) and v1 in out_df.columns:
-            v1_series = out_df[v1]
-        else:
-            v1_series = pd.Series(np.nan, index=metrics_df.index)
-
-        if isinstance(v2, str) and v2 in metrics_df.columns:
-            v2_series = metrics_df[v2]
-        elif isinstance(v2, (int, float)):
-            v2_series = pd.Series(v2, index=metrics_df.index)
-        elif isinstance(v2, str) and v2 in out_df.columns:
-            v2_series = out_df[v2]
-        else:
-            v2_series = pd.Series(np.nan, index=metrics_df.index)
+
+        v1 = resolve(row.name1)
+        unary = operation in UNARY_OPERATIONS
+        if not unary:
+            v2 = resolve(row.name2)
+
+        #  Fused numba path: no mask, gather or scatter arrays at all.
+        #  Scalar-only rows stay on the cheap scalar branch below.
+        if (_KERNELS is not None
+                and (isinstance(v1, np.ndarray)
+                     or (not unary and isinstance(v2, np.ndarray)))):
+            a = _as_kernel_operand(v1, n)
+            b = None if unary else _as_kernel_operand(v2, n)
+            if a is not None and (unary or b is not None):
+                kernel = _KERNELS[operation]
+                out = np.empty(n, dtype=np.float64)
+                if unary:
+                    kernel(a, float(v1_min), float(v1_max),
+                           float(default), out)
+                else:
+                    kernel(a, float(v1_min), float(v1_max),
+                           b, float(v2_min), float(v2_max),
+                           float(default), out)
+                out_cols[name] = out
+                continue
 
         # Determine valid mask based on operation
-        if operation in ['ln', 'exp']:
+        if unary:
             # Only v1 is used
-            valid = (v1_series >= v1_min) & (v1_series <= v1_max)
-        elif operation in ['root', 'log_base', '/', '**', '+', '-', '*']:
+            valid = _valid_mask([(v1, v1_min, v1_max)])
+        else:
             # Both v1 and v2 are used
-            valid = (
-                (v1_series >= v1_min) & (v1_series <= v1_max) &
-                (v2_series >= v2_min) & (v2_series <= v2_max)
-            )
+            valid = _valid_mask([(v1, v1_min, v1_max),
+                                 (v2, v2_min, v2_max)])
+
+        #  np.where evaluated the arithmetic on every row just to throw
+        #  the invalid ones away; computing only on the valid indices
+        #  does 1/p of the FP work for a valid fraction p.
+        op_fn = OP_TABLE[operation]
+        if isinstance(valid, np.ndarray):
+            out = np.full(n, default, dtype=np.float64)
+            valid_idx = np.flatnonzero(valid)
+            if valid_idx.size:
+                a = v1[valid_idx] if isinstance(v1, np.ndarray) else v1
+                if unary:
+                    out[valid_idx] = op_fn(a)
+                else:
+                    b = v2[valid_idx] if isinstance(v2, np.ndarray) else v2
+                    out[valid_idx] = op_fn(a, b)
         else:
-            # Fallback: require both to be valid if present
-            valid = (
-                (v1_series >= v1_min) & (v1_series <= v1_max) &
-                (v2_series >= v2_min) & (v2_series <= v2_max)
-            )
-
-        v1 = v1_series
-        v2 = v2_series
-
-        if operation == '+':
-            out_df[name] = np.where(valid, v1 + v2, default)
-        elif operation == '-':
-            out_df[name] = np.where(valid, v1 - v2, default)
-        elif operation == '*':
-            out_df[name] = np.where(valid, v1 * v2, default)
-        elif operation == '/':
-            out_df[name] = np.where(valid, v1 / v2, default)
-        elif operation == 'root':
-            out_df[name] = np.where(valid, np.power(v1, 1 / v2), default)
-        elif operation == 'log_base':
-            out_df[name] = np.where(valid, np.log(v1) / np.log(v2), default)
-        elif operation == 'ln':
-            out_df[name] = np.where(valid, np.log(v1), default)
-        elif operation == 'exp':
-            out_df[name] = np.where(valid, np.exp(v1), default)
-        elif operation == '**':
-            out_df[name] = np.where(valid, np.power(v1, v2), default)
-    return out_df
+            if valid:
+                value = op_fn(v1) if unary else op_fn(v1, v2)
+            else:
+                value = default
+            out = np.full(n, value, dtype=np.float64)
+        out_cols[name] = out
+
+    return pd.DataFrame(out_cols, index=metrics_df.index)
 
 
 def main():
     args = parse_args()
 
     # Load metrics and quantities data
-    metrics_df = pd.read_csv(args.metrics_file)
-    quantities_df = pd.read_csv(args.quantities_file)
+    metrics_df = _read_csv(args.metrics_file)
+    quantities_df = _read_csv(args.quantities_file)
 
     # Derive quantities
     derived_quantities_df = derive_quantities(metrics_df, quantities_df)
@@ -160,4 +325,4 @@ def main():
     print(f"Derived quantities saved to {output_path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,6 +4,15 @@ import os
 import pandas as pd
 
 
+def _read_csv(path):
+    #  pyarrow's CSV reader parses multi-threaded; ArrowInvalid
+    #  subclasses ValueError, so malformed files fall back to the C
+    #  parser whose errors callers already handle.
+    try:
+        return pd.read_csv(path, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(path)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -20,18 +29,29 @@ def extract_metric_name_name(filename: str) -> str:
     name = '_'.join(name)
     return name
 
+def _walk_files(work_dir):
+    #  Recursive scandir keeps the DirEntry objects, whose type and path
+    #  come from the directory read itself - no stat per entry and no
+    #  path joining per file as with os.walk.
+    with os.scandir(work_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 def get_data_files(work_dir):
     data_files = []
     metrics = set()
-    for root, _, files in os.walk(work_dir):
-        for file in files:
-            if file.startswith('data') and file.endswith('.csv'):
-                name = extract_metric_name_name(file)
-                data_files.append({
-                    'metric': name,
-                    'path': os.path.join(root, file)
-                })
-                metrics.add(name)
+    for entry in _walk_files(work_dir):
+        if entry.name.startswith('data') and entry.name.endswith('.csv'):
+            name = extract_metric_name_name(entry.name)
+            data_files.append({
+                'metric': name,
+                'path': entry.path
+            })
+            metrics.add(name)
     return data_files, metrics
 
 def extract_columns(raw_columns: list[str])-> list[dict[str, str]]:
@@ -51,37 +71,40 @@ def main():
     data_files, metrics = get_data_files(args.work_dir)
     columns, col_metrics = extract_columns(args.columns)
 
-    table = pd.DataFrame()
+    #  Per-column Series collect here, aligned on the key column, and
+    #  join in one outer concat at the end; the previous per-column
+    #  outer merge rebuilt the whole growing table every time.
+    series_parts = []
 
     for d in data_files:
         if d['metric'] not in col_metrics:
             continue
         print(f"Processing {d['metric']} from {d['path']}")
+        df = None
         for c in columns:
-            if c['metric'] == d['metric']:
-                print(f"Adding column {c['metric']}.{c['sub_metric']} from {d['path']}")
-                df = pd.read_csv(d['path'])
-                if c['sub_metric'] not in df.columns:
-                    if f'{c['sub_metric']}.' in df.columns:
-                        df[f'{c['sub_metric']}'] = df[f'{c['sub_metric']}.']
-                    else:
-                        raise ValueError(f"Sub-metric {c['sub_metric']} not found in {d['path']}.")
+            if c['metric'] != d['metric']:
+                continue
+            print(f"Adding column {c['metric']}.{c['sub_metric']} from {d['path']}")
+            if df is None:
+                #  Each file is read and normalized once, even when
+                #  several requested columns come from it.
+                df = _read_csv(d['path'])
+                #  Some writers emit a trailing dot on column names;
+                #  renaming once per file replaces the per-column alias.
+                df = df.rename(columns=lambda s: s.rstrip('.'))
                 if args.key_col not in df.columns:
                     raise ValueError(f"Key column {args.key_col} not found in {d['path']}.")
-                # temp_df = pd.DataFrame()
-                # temp_df['key'] = df[args.key_col]
-                # temp_df.set_index('key', inplace=True)
-                # temp_df[f'{c['metric']}_{c['sub_metric']}'] = df[c['sub_metric']]
+                df = df.set_index(args.key_col)
                 print(df.head())
-                # print(temp_df.head())
-
+            if c['sub_metric'] not in df.columns:
+                raise ValueError(f"Sub-metric {c['sub_metric']} not found in {d['path']}.")
+            series_parts.append(
+                df[c['sub_metric']].rename(f"{c['metric']}_{c['sub_metric']}"))
 
-                # table = pd.concat([table, temp_df], axis=1, join='outer')
-                if not table.empty:
-                    table = table.merge(df[[args.key_col, c['sub_metric']]], on=args.key_col, how='outer' ).rename(columns={c['sub_metric']: f'{c["metric"]}_{c["sub_metric"]}'})      
-                else:
-                    table = df[[args.key_col, c['sub_metric']]].rename(columns={c['sub_metric']: f'{c["metric"]}_{c["sub_metric"]}'})
-                    table.set_index(args.key_col, inplace=True)
+    if series_parts:
+        table = pd.concat(series_parts, axis=1).reset_index()
+    else:
+        table = pd.DataFrame()
 
     table.to_csv(f'{args.work_dir}/{args.table_name}.csv', index=False)
 